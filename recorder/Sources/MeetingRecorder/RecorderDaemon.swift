@@ -31,6 +31,12 @@ final class RecorderDaemon {
     private var lastError: String?
     private var lastErrorAt: Double?
 
+    // PCM captured (and written to the WAV) before activeSession was set, so
+    // never piped to the live transcriber. Its stream timestamps run early by
+    // this much; post-processing shifts them back (see streamOffsetSeconds).
+    private let streamLeadLock = NSLock()
+    private var streamLeadBytes = 0
+
     // Capture session state (hotkey voice capture)
     private var activeCaptureSession: CaptureSession?
     private var captureTranscriptSegments: [String] = []
@@ -143,7 +149,10 @@ final class RecorderDaemon {
         let wavURL = URL(fileURLWithPath: wavPath)
 
         // Start Python live transcription subprocess
-        let (pythonProcess, stdinPipe) = launchLiveTranscriber()
+        let (pythonProcess, stdinPipe) = launchLiveTranscriber(meetingId: meetingId)
+        streamLeadLock.lock()
+        streamLeadBytes = 0
+        streamLeadLock.unlock()
 
         // Re-probe TCC permission before each recording attempt
         refreshPermissionStatus()
@@ -162,8 +171,7 @@ final class RecorderDaemon {
 
             // Set up audio chunk handler: pipe PCM to Python stdin
             tap.onAudioChunk = { [weak self] data in
-                guard let pipe = self?.activeSession?.pythonStdinPipe else { return }
-                pipe.fileHandleForWriting.write(data)
+                self?.forwardAudioChunk(data)
             }
 
             // Start the tap (writes WAV + delivers chunks)
@@ -183,8 +191,7 @@ final class RecorderDaemon {
                 logger.notice("Starting recording via AUHAL fallback: meeting=\(meetingId), device=\(deviceName)")
 
                 recorder.onAudioChunk = { [weak self] data in
-                    guard let pipe = self?.activeSession?.pythonStdinPipe else { return }
-                    pipe.fileHandleForWriting.write(data)
+                    self?.forwardAudioChunk(data)
                 }
                 try recorder.startRecording(toOutputFile: wavURL, deviceID: deviceID)
             }
@@ -196,8 +203,7 @@ final class RecorderDaemon {
             logger.notice("Starting recording via AUHAL: meeting=\(meetingId), device=\(deviceName)")
 
             recorder.onAudioChunk = { [weak self] data in
-                guard let pipe = self?.activeSession?.pythonStdinPipe else { return }
-                pipe.fileHandleForWriting.write(data)
+                self?.forwardAudioChunk(data)
             }
             try recorder.startRecording(toOutputFile: wavURL, deviceID: deviceID)
 
@@ -259,6 +265,18 @@ final class RecorderDaemon {
         }
     }
 
+    /// Pipe a 16kHz int16 mono PCM chunk to the live transcriber. Chunks that
+    /// arrive before the session is set up are counted toward streamLeadBytes.
+    private func forwardAudioChunk(_ data: Data) {
+        guard let session = activeSession else {
+            streamLeadLock.lock()
+            streamLeadBytes += data.count
+            streamLeadLock.unlock()
+            return
+        }
+        session.pythonStdinPipe?.fileHandleForWriting.write(data)
+    }
+
     @discardableResult
     func stopRecording() -> String? {
         cancelZombieWatchdog()
@@ -386,7 +404,7 @@ final class RecorderDaemon {
 
     // MARK: - Python Subprocess Management
 
-    private func launchLiveTranscriber() -> (Process?, Pipe?) {
+    private func launchLiveTranscriber(meetingId: String? = nil) -> (Process?, Pipe?) {
         let pythonPath = config.pythonPath
         let scriptPath = "\(config.scriptsDir)/stream_transcribe.py"
 
@@ -410,6 +428,13 @@ final class RecorderDaemon {
         if config.language != "auto" {
             process.arguments?.append(contentsOf: ["--language", config.language])
         }
+        if let meetingId = meetingId {
+            // Persist segments for postprocess.py --reuse-stream
+            process.arguments?.append(contentsOf: [
+                "--output-dir", config.resolvedTranscriptsDir,
+                "--meeting-id", meetingId,
+            ])
+        }
 
         let stdinPipe = Pipe()
         let stdoutPipe = Pipe()
@@ -814,6 +839,10 @@ final class RecorderDaemon {
             return
         }
 
+        streamLeadLock.lock()
+        let leadBytes = streamLeadBytes
+        streamLeadLock.unlock()
+
         // Build metadata JSON for the post-processor
         let metadata: [String: Any] = [
             "meetingId": session.meetingId,
@@ -821,6 +850,8 @@ final class RecorderDaemon {
             "attendees": session.attendees,
             "startTime": ISO8601DateFormatter().string(from: session.startTime),
             "endTime": ISO8601DateFormatter().string(from: Date()),
+            // Seconds of WAV before the first chunk piped to the live transcriber
+            "streamOffsetSeconds": Double(leadBytes) / Double(16000 * MemoryLayout<Int16>.size),
         ]
 
         guard let metadataJSON = try? JSONSerialization.data(withJSONObject: metadata),
@@ -841,6 +872,10 @@ final class RecorderDaemon {
         if config.language != "auto" {
             process.arguments?.append(contentsOf: ["--language", config.language])
         }
+        if session.pythonProcess != nil {
+            // The live transcriber wrote stream-{meetingId}.jsonl; start from it
+            process.arguments?.append("--reuse-stream")
+        }
 
         // Capture stdout for transcript path output
         let stdoutPipe = Pipe()
@@ -12,16 +12,28 @@ Pipeline:
   6. (Optional) LLM correction pass via Ollama
   7. Output JSON to transcripts directory
 
-Launched by the Swift RecorderDaemon after recording stops.
+Launched by the Swift RecorderDaemon after recording stops. With --daemon,
+stays resident and processes newline-delimited JSON jobs from stdin so model
+loading is paid once rather than per meeting.
 """
 
+import re
 import sys
 import json
 import argparse
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+import torch
+from scipy.io import wavfile
+from scipy.signal import resample_poly
+
+from whisper_model import QUANTIZE_CHOICES, load_whisper_model
+
 logging.basicConfig(
     stream=sys.stderr,
     level=logging.INFO,
@@ -30,23 +42,90 @@ logging.basicConfig(
 )
 log = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def dumps_indented(value) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def dumps_indented(value) -> bytes:
+        return json.dumps(value, indent=2, ensure_ascii=False).encode("utf-8")
+
+try:
+    import soundfile as sf
+except ImportError:
+    sf = None
+
 # Paths for video-transcription-analysis integration
 VTA_CONFIG_DIR = Path.home() / ".config" / "reticle"
 SPEAKER_DB_PATH = VTA_CONFIG_DIR / "speaker-db.json"
 VOCABULARY_PATH = VTA_CONFIG_DIR / "vocabulary.yaml"
 CORRECTIONS_PATH = VTA_CONFIG_DIR / "corrections.yaml"
 
+PIPELINE_SAMPLE_RATE = 16000  # pyannote and Whisper both operate on 16kHz mono
+TURN_MERGE_COLLAR = 0.5  # seconds; same-speaker turns closer than this are merged
+
+# Full-scale divisors for integer PCM, float32 so the multiply stays float32
+INT16_SCALE = np.float32(1.0 / 32768.0)
+INT32_SCALE = np.float32(1.0 / 2147483648.0)
+PCM_SCALES = {np.dtype(np.int16): INT16_SCALE, np.dtype(np.int32): INT32_SCALE}
+
+# Reusing the live stream transcript (--reuse-stream): stream segments are
+# re-transcribed when no_speech_prob is near the stream's 0.6 drop threshold,
+# avg_logprob is below Whisper's own fallback threshold, or a long span came
+# back as a single word. Chunks the stream never transcribed are filled in:
+# always for "error" gaps, and for "silent" and "unsent" gaps louder than
+# STREAM_GAP_MIN_RMS (quiet speech under the live 0.005 gate, or audio
+# captured before the live transcriber was fed). Past
+# STREAM_MAX_RECHECK_FRACTION of the recording's duration, the whole file is
+# transcribed instead.
+STREAM_NO_SPEECH_RECHECK = 0.4
+STREAM_LOGPROB_RECHECK = -1.0
+STREAM_SHORT_SPAN_SECONDS = 2.0
+STREAM_GAP_MIN_RMS = 0.001
+STREAM_MAX_RECHECK_FRACTION = 0.25
+
+# Diarization speaker-count hint. Attendee lists exclude the user, and
+# uninvited voices (forwarded invites, someone sharing a laptop) are common,
+# so the cap leaves SPEAKER_HINT_HEADROOM extra slots. Groups, distribution
+# lists and conference rooms stand for an unknown number of people, so any
+# attendee matching GROUP_ATTENDEE_PATTERN drops the cap entirely.
+SPEAKER_HINT_HEADROOM = 2
+GROUP_ATTENDEE_PATTERN = re.compile(
+    r"@(group|resource)\.calendar\.google\.com$"
+    r"|\b(room|conference|team|group|all|everyone|staff)\b",
+    re.IGNORECASE,
+)
+
+# Joins segment texts for batched correction passes (U+241E SYMBOL FOR RECORD SEPARATOR)
+SEGMENT_SEPARATOR = "\u241e"
+# Start/end anchors in corrections.yaml (^, \A, \Z, or $ closing a pattern).
+# Anchored rules would only see the first/last segment of a batched pass.
+ANCHORED_RULE_PATTERN = re.compile(r"\^|\\[AZz]|\$(?=['\"]?\s*(:|$))", re.MULTILINE)
+
 
 def parse_args():
     p = argparse.ArgumentParser(description="Post-process a meeting recording")
-    p.add_argument("--wav", required=True, help="Path to the WAV recording")
-    p.add_argument("--metadata", required=True, help="JSON string with meeting metadata")
-    p.add_argument("--output-dir", required=True, help="Directory for output transcript JSON")
+    p.add_argument("--wav", help="Path to the WAV recording")
+    p.add_argument("--metadata", help="JSON string with meeting metadata")
+    p.add_argument("--output-dir", help="Directory for output transcript JSON")
+    p.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Stay resident: read JSON jobs {wav, metadata, output_dir} from stdin, "
+        "one per line, and write one JSON result per line to stdout",
+    )
     p.add_argument(
         "--model",
         default="mlx-community/whisper-large-v3-turbo",
         help="MLX Whisper model",
     )
+    p.add_argument(
+        "--quantize",
+        choices=QUANTIZE_CHOICES,
+        default="none",
+        help="Quantize Whisper weights at load time (none = fp16)",
+    )
     p.add_argument("--language", default=None, help="Language code (None = auto)")
     p.add_argument(
         "--skip-diarization", action="store_true", help="Skip speaker diarization"
@@ -59,30 +138,56 @@ def parse_args():
         action="store_true",
         help="Enable Ollama LLM correction pass (slow)",
     )
-    return p.parse_args()
+    p.add_argument(
+        "--reuse-stream",
+        action="store_true",
+        help="Start from the live transcript (stream-{meetingId}.jsonl in the output "
+        "dir) and only re-transcribe low-confidence segments",
+    )
+    p.add_argument(
+        "--force-full",
+        action="store_true",
+        help="Always transcribe the full file, even with --reuse-stream",
+    )
+    args = p.parse_args()
+    if not args.daemon and not (args.wav and args.metadata and args.output_dir):
+        p.error("--wav, --metadata and --output-dir are required unless --daemon is set")
+    return args
 
 
-def transcribe_audio(wav_path: str, model: str, language: str | None) -> dict:
-    """Run MLX Whisper on the full audio file with VoiceInk quality parameters."""
-    log.info("Transcribing with MLX Whisper: %s", model)
+def transcribe_audio(
+    wav_path: str,
+    model: str,
+    language: str | None,
+    quantize: str = "none",
+    samples=None,
+) -> dict:
+    """Run MLX Whisper on the full audio file with VoiceInk quality parameters.
+
+    Pass pre-decoded 16kHz mono float32 `samples` to skip Whisper's own
+    ffmpeg decode of wav_path.
+    """
+    log.info("Transcribing with MLX Whisper: %s (quantize=%s)", model, quantize)
 
     import mlx_whisper
 
+    # Loads (and optionally quantizes) once per process; transcribe() reuses it
+    load_whisper_model(model, quantize)
+
     # Build initial_prompt from vocabulary if available
     initial_prompt = None
     try:
-        from video_transcription.vocabulary import VocabularyManager
-
         if VOCABULARY_PATH.exists():
-            vocab = VocabularyManager(VOCABULARY_PATH)
-            initial_prompt = vocab.build_initial_prompt()
+            initial_prompt = _load_vocabulary_prompt(
+                VOCABULARY_PATH, VOCABULARY_PATH.stat().st_mtime
+            )
             if initial_prompt:
                 log.info("Vocabulary prompt: %s", initial_prompt[:80])
     except ImportError:
         log.debug("VocabularyManager not available, skipping vocabulary hints")
 
     result = mlx_whisper.transcribe(
-        wav_path,
+        samples if samples is not None else wav_path,
         path_or_hf_repo=model,
         language=language,
         # VoiceInk quality parameters
@@ -100,68 +205,311 @@ def transcribe_audio(wav_path: str, model: str, language: str | None) -> dict:
     return result
 
 
+def load_stream_transcript(stream_path: Path, offset: float = 0.0) -> dict | None:
+    """Parse a stream_transcribe.py JSONL file into a whisper_result dict.
+
+    Chunks the stream skipped or failed on come back under "gaps" as
+    {"start", "end", "reason"}, and the "done" line's total_seconds as
+    "total_seconds". Returns None if the file is missing, unreadable, or has
+    no trailing "done" line (the live transcriber did not finish, so it may
+    be partial).
+
+    Stream timestamps count from the first chunk piped to stream_transcribe,
+    while the WAV starts when capture starts; RecorderDaemon records the
+    difference as metadata["streamOffsetSeconds"]. All times are shifted by
+    offset onto the WAV timeline, and the unsent lead [0, offset) becomes an
+    "unsent" gap.
+    """
+    try:
+        lines = stream_path.read_bytes().splitlines()
+    except OSError:
+        return None
+
+    segments = []
+    gaps = []
+    total_seconds = None
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            log.warning("Malformed line in %s, ignoring stream transcript", stream_path)
+            return None
+        if record.get("status") == "done":
+            total_seconds = record.get("total_seconds", 0.0)
+        elif "gap" in record:
+            start, end = record["gap"]
+            gaps.append({"start": start, "end": end, "reason": record.get("reason", "error")})
+        elif "text" in record:
+            segments.append(record)
+
+    if total_seconds is None:
+        log.warning("Stream transcript %s is incomplete, ignoring it", stream_path)
+        return None
+
+    if offset > 0:
+        for seg in segments:
+            seg["start"] = round(seg["start"] + offset, 2)
+            seg["end"] = round(seg["end"] + offset, 2)
+            for w in seg.get("words", []):
+                w["start"] = round(w["start"] + offset, 2)
+                w["end"] = round(w["end"] + offset, 2)
+        for gap in gaps:
+            gap["start"] = round(gap["start"] + offset, 2)
+            gap["end"] = round(gap["end"] + offset, 2)
+        gaps.insert(0, {"start": 0.0, "end": round(offset, 2), "reason": "unsent"})
+        total_seconds += offset
+    return {"segments": segments, "gaps": gaps, "total_seconds": total_seconds}
+
+
+def _needs_recheck(seg: dict) -> bool:
+    """Whether a stream segment is too uncertain to keep as-is."""
+    if seg.get("no_speech_prob", 0.0) >= STREAM_NO_SPEECH_RECHECK:
+        return True
+    if seg.get("avg_logprob", 0.0) < STREAM_LOGPROB_RECHECK:
+        return True
+    return (
+        len(seg.get("text", "").split()) < 2
+        and seg["end"] - seg["start"] > STREAM_SHORT_SPAN_SECONDS
+    )
+
+
+def _gap_needs_transcription(gap: dict, samples) -> bool:
+    """Whether a chunk the stream never transcribed should be filled in."""
+    if gap["reason"] not in ("silent", "unsent"):
+        return True
+    span = samples[int(gap["start"] * PIPELINE_SAMPLE_RATE):int(gap["end"] * PIPELINE_SAMPLE_RATE)]
+    if len(span) == 0:
+        return False
+    span = np.asarray(span, dtype=np.float32)
+    return float(np.sqrt(np.mean(np.square(span)))) >= STREAM_GAP_MIN_RMS
+
+
+def transcribe_from_stream(
+    stream_result: dict,
+    samples,
+    model: str,
+    language: str | None,
+    quantize: str = "none",
+) -> dict | None:
+    """Patch the stream transcript with fresh Whisper output where it is weak.
+
+    Re-transcribes low-confidence stream segments and fills in gaps (chunks
+    the stream skipped as silent or failed on), merging adjacent gaps into
+    one span. samples is the decoded 16kHz mono recording. Returns None when
+    the spans to redo cover too much of the recording to be worth patching —
+    the caller should transcribe the whole file instead. stream_result must
+    already be on the WAV timeline (see load_stream_transcript).
+    """
+    stream_segments = stream_result["segments"]
+
+    # (start, end, segment or None); None marks a span to re-transcribe
+    spans = []
+    for seg in stream_segments:
+        if _needs_recheck(seg):
+            spans.append((seg["start"], seg["end"], None))
+        else:
+            spans.append((seg["start"], seg["end"], seg))
+    gap_spans = []
+    for gap in sorted(stream_result.get("gaps", []), key=lambda g: g["start"]):
+        if not _gap_needs_transcription(gap, samples):
+            continue
+        if gap_spans and gap["start"] <= gap_spans[-1][1] + 0.01:
+            gap_spans[-1] = (gap_spans[-1][0], gap["end"], None)
+        else:
+            gap_spans.append((gap["start"], gap["end"], None))
+    spans = sorted(spans + gap_spans, key=lambda span: span[0])
+
+    redo = [(start, end) for start, end, seg in spans if seg is None]
+    redo_seconds = sum(end - start for start, end in redo)
+    total_seconds = stream_result.get("total_seconds") or max(
+        (end for _, end, _ in spans), default=0.0
+    )
+    if redo_seconds > STREAM_MAX_RECHECK_FRACTION * max(total_seconds, 1e-6):
+        log.info("Stream transcript: %.1fs of %.1fs needs re-transcription, running full Whisper",
+                 redo_seconds, total_seconds)
+        return None
+
+    log.info("Reusing stream transcript: %d segments, re-transcribing %d spans (%.1fs)",
+             len(stream_segments), len(redo), redo_seconds)
+
+    segments = []
+    for start, end, seg in spans:
+        if seg is not None:
+            segments.append(seg)
+            continue
+
+        lo = int(start * PIPELINE_SAMPLE_RATE)
+        hi = int(end * PIPELINE_SAMPLE_RATE)
+        if hi <= lo:
+            continue
+        result = transcribe_audio(None, model, language, quantize, samples[lo:hi])
+        for new_seg in result.get("segments", []):
+            if new_seg.get("no_speech_prob", 0.0) > 0.6:
+                continue
+            new_seg["start"] = round(start + new_seg["start"], 2)
+            new_seg["end"] = round(start + new_seg["end"], 2)
+            for w in new_seg.get("words", []):
+                w["start"] = round(start + w["start"], 2)
+                w["end"] = round(start + w["end"], 2)
+            segments.append(new_seg)
+
+    return {"segments": segments}
+
+
+# Loaders below are cached per process. In CLI mode each runs at most once
+# anyway; in --daemon mode they keep models resident across meetings. File-
+# backed loaders take the file's mtime so edits are picked up between jobs.
+
+
+@functools.lru_cache(maxsize=1)
+def _load_vocabulary_prompt(path: Path, mtime: float) -> str | None:
+    """Build the Whisper initial_prompt from the vocabulary file."""
+    from video_transcription.vocabulary import VocabularyManager
+
+    return VocabularyManager(path).build_initial_prompt()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_diarization_pipeline():
+    """Load the pyannote diarization pipeline onto MPS (or CPU)."""
+    from pyannote.audio import Pipeline
+
+    device = torch.device("mps" if torch.backends.mps.is_available() else "cpu")
+    pipeline = Pipeline.from_pretrained(
+        "pyannote/speaker-diarization-community-1",
+        token=True,
+    )
+    pipeline.to(device)
+    return pipeline
+
+
+@functools.lru_cache(maxsize=1)
+def _load_speaker_encoder():
+    """Load the ECAPA-TDNN speaker embedding model."""
+    from speechbrain.inference.speaker import EncoderClassifier
+
+    return EncoderClassifier.from_hparams(
+        source="speechbrain/spkrec-ecapa-voxceleb",
+        run_opts={"device": "cpu"},
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _load_corrector(path: Path, mtime: float):
+    """Load the dictionary corrector for the corrections file."""
+    from video_transcription.corrector import DictionaryCorrector
+
+    return DictionaryCorrector(path)
+
+
+@functools.lru_cache(maxsize=1)
+def _corrections_anchored(path: Path, mtime: float) -> bool:
+    """Whether the corrections file appears to contain anchored rules."""
+    try:
+        return ANCHORED_RULE_PATTERN.search(path.read_text(encoding="utf-8")) is not None
+    except (OSError, UnicodeDecodeError):
+        return True
+
+
+def _pcm_to_float32(data):
+    """Convert PCM samples to float32 in [-1, 1] in one pass and one allocation.
+
+    Integer PCM is scaled by its full-scale value; other dtypes are cast as-is.
+    """
+    scale = PCM_SCALES.get(data.dtype, np.float32(1.0))
+    out = np.empty(data.shape, dtype=np.float32)
+    np.multiply(data, scale, out=out, dtype=np.float32, casting="unsafe")
+    return out
+
+
 def load_audio(wav_path: str) -> dict:
     """Load a WAV file into a waveform dict compatible with pyannote pipelines.
 
-    Uses scipy.io.wavfile to avoid torchcodec/FFmpeg dependency issues.
-    Returns {"waveform": torch.Tensor (channels, samples), "sample_rate": int}.
+    Uses soundfile (libsndfile) to avoid torchcodec/FFmpeg dependency issues;
+    it decodes straight to float32 in [-1, 1] in one pass. Falls back to a
+    memory-mapped scipy.io.wavfile read if soundfile is not installed. Audio
+    is downmixed to mono and resampled to 16kHz here, once, so pyannote
+    doesn't redo it.
+    Returns {"waveform": torch.Tensor (1, samples), "sample_rate": 16000}.
     """
-    import torch
-    from scipy.io import wavfile
-
-    sample_rate, data = wavfile.read(wav_path)
-    import numpy as np
-
-    # Convert to float32 in [-1, 1]
-    if data.dtype == np.int16:
-        audio = data.astype(np.float32) / 32768.0
-    elif data.dtype == np.int32:
-        audio = data.astype(np.float32) / 2147483648.0
-    elif data.dtype == np.float32:
-        audio = data
+    if sf is not None:
+        with sf.SoundFile(wav_path) as f:
+            sample_rate = f.samplerate
+            # always_2d gives (samples, channels) even for mono files
+            data = f.read(dtype="float32", always_2d=True)
     else:
-        audio = data.astype(np.float32)
+        # mmap avoids reading the whole int16 file into RAM before converting
+        sample_rate, raw = wavfile.read(wav_path, mmap=True)
+        if raw.ndim == 1:
+            raw = raw[:, np.newaxis]
+        data = _pcm_to_float32(raw)
+
+    audio = data.T
 
-    # Ensure 2D: (channels, samples)
-    if audio.ndim == 1:
-        audio = audio[np.newaxis, :]
-    elif audio.ndim == 2:
-        # scipy returns (samples, channels) — transpose to (channels, samples)
-        audio = audio.T
+    if audio.shape[0] > 1:
+        audio = audio.mean(axis=0, keepdims=True)
 
-    waveform = torch.from_numpy(audio)
+    if sample_rate != PIPELINE_SAMPLE_RATE:
+        audio = resample_poly(audio, PIPELINE_SAMPLE_RATE, sample_rate, axis=1).astype(np.float32)
+        sample_rate = PIPELINE_SAMPLE_RATE
+
+    waveform = torch.from_numpy(np.ascontiguousarray(audio))
     return {"waveform": waveform, "sample_rate": sample_rate}
 
 
-def run_diarization(wav_path: str) -> list[dict]:
-    """Run pyannote speaker diarization, return list of {start, end, speaker} segments."""
+def speaker_count_hint(attendees: list[str]) -> int | None:
+    """Upper bound on distinct voices for run_diarization, or None if unknown.
+
+    None when no attendees were provided (not a solo meeting) or when any
+    attendee is a group or room resource.
+    """
+    if not attendees:
+        return None
+    if any(GROUP_ATTENDEE_PATTERN.search(a) for a in attendees):
+        log.info("Attendee list includes a group or room, not bounding speaker count")
+        return None
+    return len(attendees) + 1 + SPEAKER_HINT_HEADROOM
+
+
+def run_diarization(
+    wav_path: str, audio: dict | None = None, max_speakers: int | None = None
+) -> list[dict]:
+    """Run pyannote speaker diarization, return list of {start, end, speaker} segments.
+
+    Pass an `audio` dict from load_audio() to reuse an already-decoded WAV.
+    max_speakers bounds pyannote's speaker-count search when the attendee
+    list is known.
+    """
     log.info("Running speaker diarization...")
 
     try:
-        from pyannote.audio import Pipeline
+        from pyannote.audio import Pipeline  # noqa: F401 — availability check
     except ImportError:
         log.warning("pyannote.audio not installed, skipping diarization")
         return []
 
-    import torch
-
-    device = torch.device("mps" if torch.backends.mps.is_available() else "cpu")
     try:
-        pipeline = Pipeline.from_pretrained(
-            "pyannote/speaker-diarization-community-1",
-            token=True,
-        )
-        pipeline.to(device)
+        pipeline = _load_diarization_pipeline()
 
-        # Pre-load audio with scipy to avoid torchcodec/FFmpeg issues
-        audio = load_audio(wav_path)
-        result = pipeline(audio)
+        # Pre-load audio with soundfile to avoid torchcodec/FFmpeg issues
+        if audio is None:
+            audio = load_audio(wav_path)
+        if max_speakers is not None:
+            result = pipeline(audio, max_speakers=max_speakers)
+        else:
+            result = pipeline(audio)
 
         # pyannote 4.x returns DiarizeOutput; extract the Annotation object
         if hasattr(result, 'speaker_diarization'):
             diarization = result.speaker_diarization
         else:
             diarization = result  # pyannote 3.x returns Annotation directly
+
+        # Collapse same-speaker fragments separated by short pauses so
+        # alignment and merging iterate over far fewer turns
+        diarization = diarization.support(collar=TURN_MERGE_COLLAR)
     except Exception as e:
         log.warning("Diarization failed (continuing without speaker labels): %s", e)
         return []
@@ -204,34 +552,74 @@ def align_transcript_with_speakers(
             if seg.get("text", "").strip()
         ]
 
-    def compute_speaker_overlap(word_start: float, word_end: float) -> str:
-        """Assign a word to the speaker with the greatest temporal overlap."""
-        best_speaker = "Unknown"
-        best_overlap = 0.0
-
-        for ss in speaker_segments:
-            overlap_start = max(word_start, ss["start"])
-            overlap_end = min(word_end, ss["end"])
-            overlap = max(0.0, overlap_end - overlap_start)
-            if overlap > best_overlap:
-                best_overlap = overlap
-                best_speaker = ss["speaker"]
-
-        if best_overlap > 0:
-            return best_speaker
-
-        # No overlap — find nearest speaker segment within 2s
-        min_dist = float("inf")
-        nearest = "Unknown"
+    # Speakers are handled as integer ids so the per-segment vote is a
+    # bincount; UNKNOWN_ID is the sentinel for words with no nearby turn.
+    speaker_names = list(dict.fromkeys(s["speaker"] for s in speaker_segments))
+    UNKNOWN_ID = len(speaker_names)
+    speaker_names.append("Unknown")
+    name_to_id = {name: i for i, name in enumerate(speaker_names[:UNKNOWN_ID])}
+    turn_speaker_ids = np.array(
+        [name_to_id[s["speaker"]] for s in speaker_segments], dtype=np.int64
+    )
+
+    # Sort turns once so each word lookup is a binary search rather than a
+    # scan over every turn in the meeting. Ties are broken by original index
+    # so results match a first-match linear scan.
+    order = np.array(
+        sorted(range(len(speaker_segments)), key=lambda i: speaker_segments[i]["start"]),
+        dtype=np.int64,
+    )
+    all_starts = np.array([s["start"] for s in speaker_segments], dtype=np.float64)
+    all_ends = np.array([s["end"] for s in speaker_segments], dtype=np.float64)
+    starts = all_starts[order]
+    ends = all_ends[order]
+    # Turns may overlap, so bound the left edge with the running max of ends
+    max_end_so_far = np.maximum.accumulate(ends)
+    # Separate end-sorted view for the nearest-boundary fallback
+    end_order = np.lexsort((np.arange(len(all_ends)), all_ends))
+    ends_sorted = all_ends[end_order]
+
+    def nearest_candidates(sorted_values: np.ndarray, positions: np.ndarray, t: float):
+        """Yield (distance, original index) for the values bracketing t."""
+        i = int(np.searchsorted(sorted_values, t))
+        for j in (i - 1, i):
+            if 0 <= j < len(sorted_values):
+                # Snap to the first of any equal values (lowest original index)
+                j = int(np.searchsorted(sorted_values, sorted_values[j], side="left"))
+                yield abs(sorted_values[j] - t), int(positions[j])
+
+    def speaker_for_span(word_start: float, word_end: float, lo: int, hi: int) -> int:
+        """Speaker id with the greatest temporal overlap; turns [lo, hi) are the candidates."""
+        if lo < hi:
+            overlaps = np.minimum(ends[lo:hi], word_end) - np.maximum(starts[lo:hi], word_start)
+            best_overlap = overlaps.max()
+            if best_overlap > 0:
+                tied = order[lo:hi][overlaps == best_overlap]
+                return int(turn_speaker_ids[tied.min()])
+
+        # No overlap — find nearest speaker segment boundary within 2s
         word_mid = (word_start + word_end) / 2
-        for ss in speaker_segments:
-            dist = min(abs(ss["start"] - word_mid), abs(ss["end"] - word_mid))
-            if dist < min_dist:
-                min_dist = dist
-                nearest = ss["speaker"]
-        return nearest if min_dist < 2.0 else "Unknown"
+        candidates = list(nearest_candidates(starts, order, word_mid))
+        candidates += nearest_candidates(ends_sorted, end_order, word_mid)
+        min_dist, nearest = min(candidates)
+        return int(turn_speaker_ids[nearest]) if min_dist < 2.0 else UNKNOWN_ID
+
+    def compute_speaker_ids(word_starts: np.ndarray, word_ends: np.ndarray) -> np.ndarray:
+        """Assign each word span to the speaker with the greatest temporal overlap."""
+        # Only turns with start < word_end and end > word_start can overlap
+        los = np.searchsorted(max_end_so_far, word_starts, side="right")
+        his = np.searchsorted(starts, word_ends, side="left")
+        return np.fromiter(
+            (
+                speaker_for_span(word_starts[k], word_ends[k], int(los[k]), int(his[k]))
+                for k in range(len(word_starts))
+            ),
+            dtype=np.int64,
+            count=len(word_starts),
+        )
 
     aligned = []
+    aligned_ids = []
     for seg in whisper_result.get("segments", []):
         text = seg.get("text", "").strip()
         if not text:
@@ -240,16 +628,21 @@ def align_transcript_with_speakers(
         words = seg.get("words", [])
         if words:
             # Duration-weighted vote: longer words count more
-            speaker_weight: dict[str, float] = {}
-            for word in words:
-                ws = word.get("start", seg["start"])
-                we = word.get("end", seg["end"])
-                duration = max(we - ws, 0.01)  # avoid zero-weight
-                spk = compute_speaker_overlap(ws, we)
-                speaker_weight[spk] = speaker_weight.get(spk, 0.0) + duration
-            speaker = max(speaker_weight, key=speaker_weight.get)  # type: ignore[arg-type]
+            word_starts = np.array([w.get("start", seg["start"]) for w in words], dtype=np.float64)
+            word_ends = np.array([w.get("end", seg["end"]) for w in words], dtype=np.float64)
+            durations = np.maximum(word_ends - word_starts, 0.01)  # avoid zero-weight
+            ids = compute_speaker_ids(word_starts, word_ends)
+            weights = np.bincount(ids, weights=durations)
+            tied = np.flatnonzero(weights == weights.max())
+            # On a tie, the speaker heard first in the segment wins
+            winner = tied[0] if len(tied) == 1 else ids[np.isin(ids, tied)][0]
         else:
-            speaker = compute_speaker_overlap(seg["start"], seg["end"])
+            winner = compute_speaker_ids(
+                np.array([seg["start"]], dtype=np.float64),
+                np.array([seg["end"]], dtype=np.float64),
+            )[0]
+        speaker = speaker_names[winner]
+        aligned_ids.append(winner)
 
         aligned.append(
             {
@@ -260,19 +653,28 @@ def align_transcript_with_speakers(
             }
         )
 
-    # Merge consecutive segments from the same speaker
-    merged = []
-    for seg in aligned:
-        if merged and merged[-1]["speaker"] == seg["speaker"]:
-            # Check for reasonable gap (< 1.5s)
-            gap = seg["start"] - merged[-1]["end"]
-            if gap < 1.5:
-                merged[-1]["end"] = seg["end"]
-                merged[-1]["text"] += " " + seg["text"]
-                continue
-        merged.append(dict(seg))
+    if not aligned:
+        return []
 
-    return merged
+    # Merge consecutive segments from the same speaker with a reasonable gap
+    # (< 1.5s). Run boundaries are found in one vectorized pass; only the
+    # text joins remain per merged segment.
+    run_ids = np.array(aligned_ids, dtype=np.int64)
+    seg_starts = np.array([seg["start"] for seg in aligned], dtype=np.float64)
+    seg_ends = np.array([seg["end"] for seg in aligned], dtype=np.float64)
+    continues = (run_ids[1:] == run_ids[:-1]) & (seg_starts[1:] - seg_ends[:-1] < 1.5)
+    run_starts = np.flatnonzero(np.concatenate(([True], ~continues)))
+    run_ends = np.append(run_starts[1:], len(aligned))
+
+    return [
+        {
+            "start": aligned[lo]["start"],
+            "end": aligned[hi - 1]["end"],
+            "text": " ".join(seg["text"] for seg in aligned[lo:hi]),
+            "speaker": aligned[lo]["speaker"],
+        }
+        for lo, hi in zip(run_starts.tolist(), run_ends.tolist())
+    ]
 
 
 def identify_speakers(
@@ -301,26 +703,13 @@ def identify_speakers(
 
     # Try to compute embeddings for each speaker cluster
     try:
-        import torch
-        import numpy as np
-        from scipy.io import wavfile
-    except ImportError:
-        log.warning("torch/scipy not available for speaker embedding extraction")
-        return segments, [{"label": s, "name": s, "confidence": 0.0} for s in unique_speakers]
-
-    try:
-        from speechbrain.inference.speaker import EncoderClassifier
-        classifier = EncoderClassifier.from_hparams(
-            source="speechbrain/spkrec-ecapa-voxceleb",
-            run_opts={"device": "cpu"},
-        )
+        classifier = _load_speaker_encoder()
     except Exception as e:
         log.warning("ECAPA-TDNN model unavailable (%s), skipping identification", e)
         return segments, [{"label": s, "name": s, "confidence": 0.0} for s in unique_speakers]
 
     sample_rate, full_audio = wavfile.read(wav_path)
-    if full_audio.dtype == np.int16:
-        full_audio = full_audio.astype(np.float32) / 32768.0
+    full_audio = _pcm_to_float32(full_audio)
     # Mono
     if full_audio.ndim == 2:
         full_audio = full_audio.mean(axis=1)
@@ -329,11 +718,12 @@ def identify_speakers(
     speaker_info: list[dict] = []
     SIMILARITY_THRESHOLD = 0.65
 
+    # Extract up to 30s of audio per speaker cluster
+    max_samples = sample_rate * 30
+    speaker_audio: dict[str, np.ndarray] = {}
     for speaker_label in unique_speakers:
-        # Extract up to 30s of audio for this speaker cluster
         clips = []
         total_samples = 0
-        max_samples = sample_rate * 30
         for seg in segments:
             if seg["speaker"] == speaker_label and total_samples < max_samples:
                 start_sample = int(seg["start"] * sample_rate)
@@ -342,23 +732,38 @@ def identify_speakers(
                 clips.append(clip)
                 total_samples += len(clip)
 
-        if not clips or total_samples < sample_rate:  # need at least 1s
-            speaker_info.append({"label": speaker_label, "name": speaker_label, "confidence": 0.0})
-            continue
+        if clips and total_samples >= sample_rate:  # need at least 1s
+            speaker_audio[speaker_label] = np.concatenate(clips)
+
+    # Embed every cluster in one padded forward pass; wav_lens masks the padding
+    batch_labels = list(speaker_audio)
+    best_matches: dict[str, tuple[str, float]] = {}
+    if batch_labels:
+        waveforms = [torch.from_numpy(speaker_audio[label]) for label in batch_labels]
+        lengths = torch.tensor([len(w) for w in waveforms], dtype=torch.float32)
+        batch = torch.nn.utils.rnn.pad_sequence(waveforms, batch_first=True)
+        embeddings = (
+            classifier.encode_batch(batch, wav_lens=lengths / lengths.max())
+            .reshape(len(batch_labels), -1)
+            .detach()
+            .numpy()
+        )
 
-        combined = np.concatenate(clips)
-        waveform = torch.from_numpy(combined).unsqueeze(0)
-        embedding = classifier.encode_batch(waveform).squeeze().detach().numpy()
+        # Compare all clusters against all known embeddings at once
+        known_names = [known["name"] for known in known_embeddings]
+        known_matrix = np.array([known["embedding"] for known in known_embeddings], dtype=np.float32)
+        similarities = _cosine_similarity_matrix(embeddings, known_matrix)
+        for label, row in zip(batch_labels, similarities):
+            best = int(np.argmax(row))
+            if row[best] > 0:
+                best_matches[label] = (known_names[best], float(row[best]))
 
-        # Compare against known embeddings
-        best_name = speaker_label
-        best_sim = 0.0
-        for known in known_embeddings:
-            sim = _cosine_similarity(embedding, known["embedding"])
-            if sim > best_sim:
-                best_sim = sim
-                best_name = known["name"]
+    for speaker_label in unique_speakers:
+        if speaker_label not in speaker_audio:
+            speaker_info.append({"label": speaker_label, "name": speaker_label, "confidence": 0.0})
+            continue
 
+        best_name, best_sim = best_matches.get(speaker_label, (speaker_label, 0.0))
         if best_sim >= SIMILARITY_THRESHOLD:
             speaker_map[speaker_label] = best_name
             log.info("Speaker %s → %s (similarity: %.3f)", speaker_label, best_name, best_sim)
@@ -404,20 +809,25 @@ def _fetch_known_embeddings(gateway_url: str) -> list[dict]:
     return result
 
 
-def _cosine_similarity(a, b) -> float:
-    """Compute cosine similarity between two vectors."""
-    import numpy as np
-    a = np.array(a, dtype=np.float32)
-    b = np.array(b, dtype=np.float32)
-    dot = np.dot(a, b)
-    norm = np.linalg.norm(a) * np.linalg.norm(b)
-    return float(dot / norm) if norm > 0 else 0.0
+def _cosine_similarity_matrix(a, b):
+    """Cosine similarity between each row of a (N, D) and each row of b (M, D).
+
+    Returns an (N, M) array; rows or columns with zero norm score 0.
+    """
+    a = np.asarray(a, dtype=np.float32)
+    b = np.asarray(b, dtype=np.float32)
+    norms = np.outer(np.linalg.norm(a, axis=1), np.linalg.norm(b, axis=1))
+    dots = a @ b.T
+    return np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
 
 
 def apply_corrections(segments: list[dict]) -> list[dict]:
     """Apply dictionary-based corrections to segment text."""
+    if not segments:
+        return segments
+
     try:
-        from video_transcription.corrector import DictionaryCorrector
+        from video_transcription.corrector import DictionaryCorrector  # noqa: F401
     except ImportError:
         log.debug("DictionaryCorrector not available, skipping corrections")
         return segments
@@ -426,14 +836,35 @@ def apply_corrections(segments: list[dict]) -> list[dict]:
         log.info("No corrections file at %s, skipping", CORRECTIONS_PATH)
         return segments
 
-    corrector = DictionaryCorrector(CORRECTIONS_PATH)
+    mtime = CORRECTIONS_PATH.stat().st_mtime
+    corrector = _load_corrector(CORRECTIONS_PATH, mtime)
     total_corrections = 0
 
-    for seg in segments:
-        corrected, stats = corrector.correct(seg["text"])
-        if stats.total_replacements > 0:
-            total_corrections += stats.total_replacements
-            seg["text"] = corrected
+    # One corrector pass over the whole transcript instead of one per segment.
+    # The separator is a non-word, non-space symbol, so rules can't match
+    # across segment boundaries. Anchored rules need each segment on its own.
+    corrected_texts = None
+    if _corrections_anchored(CORRECTIONS_PATH, mtime):
+        log.debug("Corrections include anchored rules, correcting per segment")
+    else:
+        texts = [seg["text"] for seg in segments]
+        corrected, stats = corrector.correct(SEGMENT_SEPARATOR.join(texts))
+        corrected_texts = corrected.split(SEGMENT_SEPARATOR)
+        if len(corrected_texts) != len(segments):
+            # A correction touched a separator — redo segment by segment
+            log.debug("Batched corrections changed segment count, falling back to per-segment")
+            corrected_texts = None
+
+    if corrected_texts is not None:
+        total_corrections = stats.total_replacements
+        for seg, text in zip(segments, corrected_texts):
+            seg["text"] = text
+    else:
+        for seg in segments:
+            corrected, stats = corrector.correct(seg["text"])
+            if stats.total_replacements > 0:
+                total_corrections += stats.total_replacements
+                seg["text"] = corrected
 
     if total_corrections:
         log.info("Applied %d dictionary corrections", total_corrections)
@@ -473,11 +904,11 @@ def build_output(
     wav_path: str,
     model: str,
 ) -> dict:
-    """Build the final output JSON."""
-    full_text = "\n".join(
-        f"[{s['speaker']}] {s['text']}" for s in segments
-    )
+    """Build the final output JSON.
 
+    fullText is not included here; write_output streams it from the segments
+    so the transcript is never held in memory twice.
+    """
     return {
         "meetingId": metadata.get("meetingId", ""),
         "title": metadata.get("title", ""),
@@ -485,7 +916,6 @@ def build_output(
         "endTime": metadata.get("endTime", ""),
         "attendees": metadata.get("attendees", []),
         "segments": segments,
-        "fullText": full_text,
         "speakers": speaker_info,
         "model": model,
         "audioFile": wav_path,
@@ -493,6 +923,51 @@ def build_output(
     }
 
 
+def write_output(output_path: Path, output: dict) -> None:
+    """Write the transcript JSON incrementally, adding fullText after segments.
+
+    Produces the same bytes as json.dump(indent=2, ensure_ascii=False) on the
+    complete document, but encodes one segment at a time and streams fullText
+    line by line instead of building either as one large string. Values are
+    encoded with orjson when it is installed; its output differs from the
+    stdlib only in how very small or large floats are spelled (1e-5 vs 1e-05).
+    """
+
+    def encode(value, level: int) -> bytes:
+        # JSON strings never contain raw newlines, so re-indenting is safe
+        return dumps_indented(value).replace(b"\n", b"\n" + b"  " * level)
+
+    segments = output["segments"]
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        f.write(b"{")
+        for i, (key, value) in enumerate(output.items()):
+            f.write(b",\n  " if i else b"\n  ")
+            f.write(dumps_indented(key) + b": ")
+
+            if key != "segments":
+                f.write(encode(value, 1))
+                continue
+
+            if not segments:
+                f.write(b"[]")
+            else:
+                f.write(b"[")
+                for j, seg in enumerate(segments):
+                    f.write(b",\n    " if j else b"\n    ")
+                    f.write(encode(seg, 2))
+                f.write(b"\n  ]")
+
+            # fullText: "[speaker] text" per segment, newline-joined
+            f.write(b',\n  "fullText": "')
+            for j, seg in enumerate(segments):
+                if j:
+                    f.write(b"\\n")
+                line = f"[{seg['speaker']}] {seg['text']}"
+                f.write(dumps_indented(line)[1:-1])
+            f.write(b'"')
+        f.write(b"\n}")
+
+
 def check_audio_present(wav_path: str, threshold_rms: float = 0.003, sample_size: int = 50_000) -> bool:
     """Return False if the WAV is mostly digital silence, True if real audio is present.
 
@@ -527,12 +1002,11 @@ def check_audio_present(wav_path: str, threshold_rms: float = 0.003, sample_size
     return True
 
 
-def main():
-    args = parse_args()
-
-    metadata = json.loads(args.metadata)
-    wav_path = args.wav
-    output_dir = Path(args.output_dir)
+def process_recording(
+    wav_path: str, metadata: dict, output_dir: Path, args: argparse.Namespace
+) -> Path | None:
+    """Run the full pipeline for one recording. Returns the transcript path,
+    or None if the recording was skipped as silent."""
     output_dir.mkdir(parents=True, exist_ok=True)
 
     log.info("Post-processing: %s (%s)", metadata.get("title", "?"), wav_path)
@@ -540,22 +1014,52 @@ def main():
     # Pre-check: skip Whisper entirely if the WAV is silent (phantom recording guard)
     if not check_audio_present(wav_path):
         log.warning("Skipping transcription: WAV is silent. No transcript will be written.")
-        return
+        return None
 
-    # Step 1: Transcribe
-    whisper_result = transcribe_audio(wav_path, args.model, args.language)
+    # Decode once; Whisper and pyannote both take the same 16kHz mono waveform
+    audio = None
+    samples = None
+    try:
+        audio = load_audio(wav_path)
+        samples = audio["waveform"][0].numpy()
+    except Exception as e:
+        log.warning("Could not pre-load audio (%s), models will read the WAV themselves", e)
 
-    # Step 2: Diarize
-    speaker_segments = []
-    if not args.skip_diarization:
-        speaker_segments = run_diarization(wav_path)
+    attendees = metadata.get("attendees", [])
+    max_speakers = speaker_count_hint(attendees)
+
+    # Steps 1 + 2 run concurrently: Whisper (MLX) and pyannote (torch) use
+    # separate backends, so wall-clock is the slower of the two, not the sum
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        diarization = None
+        if not args.skip_diarization:
+            diarization = pool.submit(run_diarization, wav_path, audio, max_speakers)
+
+        # Step 1: Transcribe, starting from the live transcript if allowed
+        whisper_result = None
+        stream_path = None
+        if args.reuse_stream and not args.force_full and samples is not None:
+            stream_path = output_dir / f"stream-{metadata.get('meetingId', 'unknown')}.jsonl"
+            stream_result = load_stream_transcript(
+                stream_path, float(metadata.get("streamOffsetSeconds") or 0.0)
+            )
+            if stream_result is not None:
+                whisper_result = transcribe_from_stream(
+                    stream_result, samples, args.model, args.language, args.quantize
+                )
+        if whisper_result is None:
+            whisper_result = transcribe_audio(
+                wav_path, args.model, args.language, args.quantize, samples
+            )
+
+        # Step 2: Diarize
+        speaker_segments = diarization.result() if diarization else []
 
     # Step 3: Align transcript with speakers
     segments = align_transcript_with_speakers(whisper_result, speaker_segments)
     log.info("Aligned %d segments", len(segments))
 
     # Step 4: Identify speakers
-    attendees = metadata.get("attendees", [])
     segments, speaker_info = identify_speakers(segments, wav_path, attendees)
 
     # Step 5: Apply corrections
@@ -573,12 +1077,71 @@ def main():
     date_str = datetime.now().strftime("%Y-%m-%d")
     output_path = output_dir / f"meeting-{meeting_id}-{date_str}.json"
 
-    with open(output_path, "w") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    write_output(output_path, output)
+    if stream_path is not None:
+        # The live transcript has been merged (or superseded); don't leave it behind
+        stream_path.unlink(missing_ok=True)
 
     log.info("Transcript written to %s", output_path)
-    # Print path to stdout for the caller
-    print(str(output_path))
+    return output_path
+
+
+def run_daemon(args: argparse.Namespace) -> None:
+    """Process jobs from stdin until EOF, keeping models loaded between them.
+
+    Input:  one JSON object per line: {"wav", "metadata", "output_dir"}
+            (metadata may be an object or a JSON string)
+    Output: {"status": "ready"} once models are loaded, then one line per job:
+            {"wav", "transcript"} (transcript is null if skipped as silent)
+            or {"wav", "error"} on failure.
+    """
+    log.info("Daemon mode: preloading models...")
+    load_whisper_model(args.model, args.quantize)
+    if not args.skip_diarization:
+        try:
+            _load_diarization_pipeline()
+        except Exception as e:
+            log.warning("Diarization pipeline preload failed (will retry per job): %s", e)
+
+    sys.stdout.write(json.dumps({"status": "ready", "model": args.model}) + "\n")
+    sys.stdout.flush()
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        wav_path = None
+        try:
+            job = json.loads(line)
+            wav_path = job["wav"]
+            metadata = job.get("metadata") or {}
+            if isinstance(metadata, str):
+                metadata = json.loads(metadata)
+            output_path = process_recording(wav_path, metadata, Path(job["output_dir"]), args)
+            result = {"wav": wav_path, "transcript": str(output_path) if output_path else None}
+        except Exception as e:
+            log.exception("Post-processing job failed")
+            result = {"wav": wav_path, "error": str(e)}
+
+        sys.stdout.write(json.dumps(result) + "\n")
+        sys.stdout.flush()
+
+    log.info("EOF on stdin, exiting")
+
+
+def main():
+    args = parse_args()
+
+    if args.daemon:
+        run_daemon(args)
+        return
+
+    metadata = json.loads(args.metadata)
+    output_path = process_recording(args.wav, metadata, Path(args.output_dir), args)
+    if output_path is not None:
+        # Print path to stdout for the caller
+        print(str(output_path))
 
 
 if __name__ == "__main__":
@@ -6,6 +6,13 @@ Protocol:
   - Output: One JSON object per line on stdout with keys:
             {"text", "start", "end", "no_speech_prob", "is_final"}
   - Stderr: Diagnostic/log messages only
+  - File:   With --output-dir and --meeting-id, the same segments (plus word
+            timings and avg_logprob) are appended to
+            {output_dir}/stream-{meeting_id}.jsonl, ending with the "done"
+            status line, so post-processing can reuse them. Chunks that
+            produced no segments because they were gated as silent or
+            failed to transcribe are recorded as
+            {"gap": [start, end], "reason": "silent" | "error"}.
 
 Launched by the Swift RecorderDaemon as a subprocess.
 """
@@ -13,11 +20,14 @@ Launched by the Swift RecorderDaemon as a subprocess.
 import sys
 import json
 import time
+from pathlib import Path
 import struct
 import argparse
 import logging
 import numpy as np
 
+from whisper_model import QUANTIZE_CHOICES, load_whisper_model
+
 logging.basicConfig(
     stream=sys.stderr,
     level=logging.INFO,
@@ -26,6 +36,15 @@ logging.basicConfig(
 )
 log = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 
 def parse_args():
     p = argparse.ArgumentParser(description="Live streaming Whisper transcription")
@@ -34,6 +53,12 @@ def parse_args():
         default="mlx-community/whisper-large-v3-turbo",
         help="HuggingFace model repo for MLX Whisper",
     )
+    p.add_argument(
+        "--quantize",
+        choices=QUANTIZE_CHOICES,
+        default="none",
+        help="Quantize Whisper weights at load time (none = fp16)",
+    )
     p.add_argument(
         "--language", default=None, help="Language code (e.g. 'en'). None = auto-detect."
     )
@@ -48,93 +73,219 @@ def parse_args():
         default=None,
         help="Vocabulary terms to include in initial_prompt",
     )
+    p.add_argument(
+        "--output-dir",
+        default=None,
+        help="Also persist segments to {output-dir}/stream-{meeting-id}.jsonl",
+    )
+    p.add_argument(
+        "--meeting-id", default=None, help="Meeting ID used to name the stream transcript"
+    )
     return p.parse_args()
 
 
 SAMPLE_RATE = 16000
 SAMPLE_WIDTH = 2  # 16-bit = 2 bytes per sample
+PCM_SCALE = np.float32(1.0 / 32768.0)
+SILENCE_RMS = 0.005  # Normalized RMS below which a chunk is not transcribed
+PROMPT_CONTEXT_CHARS = 200  # Prior text carried into the next chunk's prompt
+
+# Reused raw-input and float32 output buffers, grown on demand to the chunk size
+_PCM_RAW: bytearray | None = None
+_PCM_BUF: np.ndarray | None = None
 
 
-def read_pcm_stdin(buffer_seconds: float) -> np.ndarray | None:
-    """Read a chunk of PCM audio from stdin, return as float32 numpy array.
+def read_pcm_stdin(buffer_seconds: float) -> tuple[np.ndarray | None, bool] | None:
+    """Read a chunk of PCM audio from stdin.
 
-    Returns None on EOF.
+    Returns (samples, is_silent), or None on EOF. The silence gate runs on
+    the raw int16 samples, so silent chunks skip float conversion entirely
+    and come back as (None, True). Otherwise samples is a float32 view into
+    a module-level buffer that is overwritten by the next call — consume it
+    before reading again.
     """
+    global _PCM_RAW, _PCM_BUF
+
     num_samples = int(SAMPLE_RATE * buffer_seconds)
     num_bytes = num_samples * SAMPLE_WIDTH
 
-    data = sys.stdin.buffer.read(num_bytes)
-    if not data:
+    if _PCM_RAW is None or len(_PCM_RAW) < num_bytes:
+        _PCM_RAW = bytearray(num_bytes)
+    # sys.stdin.buffer is a BufferedReader (-u only unbuffers stdout/stderr),
+    # so readinto blocks until the chunk is full and is short only at EOF
+    n_read = sys.stdin.buffer.readinto(memoryview(_PCM_RAW)[:num_bytes])
+    if not n_read:
         return None
 
+    # Zero-copy int16 view over the bytes just read
+    view = np.frombuffer(_PCM_RAW, dtype=np.int16, count=n_read // SAMPLE_WIDTH)
+
+    # RMS over the padded chunk: rms < SILENCE_RMS  <=>  sum(x^2) < (SILENCE_RMS * 32768)^2 * N
+    sum_squares = int(np.einsum("i,i->", view, view, dtype=np.int64))
+    if sum_squares < (SILENCE_RMS * 32768.0) ** 2 * num_samples:
+        return None, True
+
+    if _PCM_BUF is None or _PCM_BUF.size < num_samples:
+        _PCM_BUF = np.empty(num_samples, dtype=np.float32)
+    samples = _PCM_BUF[:num_samples]
+
+    # Convert signed 16-bit LE PCM to float32 in [-1, 1] in a single pass
+    np.multiply(view, PCM_SCALE, out=samples[:view.size])
+
     # Pad with silence if we got a partial read (end of stream)
-    if len(data) < num_bytes:
-        data = data + b"\x00" * (num_bytes - len(data))
+    samples[view.size:] = 0.0
+    return samples, False
+
+
+def emit(messages: list[dict]) -> None:
+    """Write JSON lines to stdout as one write + flush.
 
-    # Convert signed 16-bit LE PCM to float32 in [-1, 1]
-    samples = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
-    return samples
+    The daemon runs us with -u, so each write is a syscall; batching a
+    chunk's segments keeps that to one per chunk.
+    """
+    if not messages:
+        return
+    out = sys.stdout.buffer
+    out.write(b"".join(dumps(m) + b"\n" for m in messages))
+    out.flush()
+
+
+def open_stream_transcript(output_dir: str | None, meeting_id: str | None):
+    """Open the persisted stream transcript for writing, or return None.
+
+    Each run rewrites the file: a meeting's audio always starts at t=0, so a
+    leftover file from an aborted run would only mislead post-processing.
+    """
+    if not output_dir or not meeting_id:
+        return None
+    path = Path(output_dir) / f"stream-{meeting_id}.jsonl"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        log.info("Persisting stream transcript to %s", path)
+        return open(path, "wb", buffering=0)
+    except OSError as e:
+        log.warning("Cannot write stream transcript %s: %s", path, e)
+        return None
+
+
+def persist(stream_file, messages: list[dict]) -> None:
+    """Append JSON lines to the stream transcript, if one is open."""
+    if stream_file is None or not messages:
+        return
+    try:
+        stream_file.write(b"".join(dumps(m) + b"\n" for m in messages))
+    except OSError as e:
+        log.warning("Stream transcript write failed: %s", e)
+
+
+def build_prompt(vocab_prompt: str | None, previous_text: str) -> str | None:
+    """initial_prompt for the next chunk: vocabulary hints plus recent text.
+
+    When the context is truncated it is cut at a word boundary so the prompt
+    never opens with a word fragment, which would tokenize into junk prefill
+    tokens. Unspaced text (e.g. CJK) has no boundary to cut at and is kept
+    as the raw slice.
+    """
+    context = previous_text[-PROMPT_CONTEXT_CHARS:]
+    cut_mid_word = (
+        len(previous_text) > PROMPT_CONTEXT_CHARS
+        and previous_text[-PROMPT_CONTEXT_CHARS - 1] != " "
+    )
+    if cut_mid_word and " " in context:
+        # Drop the leading fragment only; a slice starting on a word is whole
+        context = context.partition(" ")[2]
+    return f"{vocab_prompt or ''} {context}".strip() or None
+
+
+def transcribe_chunk(
+    audio: np.ndarray, model: str, language: str | None, initial_prompt: str | None
+) -> dict:
+    """Transcribe one chunk with the live decoding parameters."""
+    import mlx_whisper
+
+    return mlx_whisper.transcribe(
+        audio,
+        path_or_hf_repo=model,
+        language=language,
+        # VoiceInk quality parameters
+        temperature=0.2,
+        condition_on_previous_text=False,
+        no_speech_threshold=0.6,
+        hallucination_silence_threshold=0.5,
+        word_timestamps=True,
+        initial_prompt=initial_prompt,
+        verbose=False,
+    )
+
+
+def warm_up(model: str, language: str | None, initial_prompt: str | None) -> None:
+    """Run one throwaway transcription on silence before accepting audio.
+
+    The first transcribe() call pays for kernel compilation and tokenizer
+    setup; doing it here keeps that latency off the first real chunk. It
+    goes through transcribe_chunk so the same decode paths (word-timestamp
+    alignment, prompt prefill) are the ones warmed.
+    """
+    started = time.monotonic()
+    try:
+        transcribe_chunk(
+            np.zeros(SAMPLE_RATE // 2, dtype=np.float32), model, language, initial_prompt
+        )
+    except Exception:
+        log.exception("Warm-up transcription failed (continuing)")
+        return
+    log.info("Warm-up complete in %.2fs", time.monotonic() - started)
 
 
 def main():
     args = parse_args()
 
-    log.info("Loading MLX Whisper model: %s", args.model)
-    import mlx_whisper
+    log.info("Loading MLX Whisper model: %s (quantize=%s)", args.model, args.quantize)
+
+    # Load once up front; every transcribe() below reuses the cached model
+    load_whisper_model(args.model, args.quantize)
+    warm_up(args.model, args.language, build_prompt(args.vocab_prompt, ""))
 
     log.info("Model loaded. Listening for audio on stdin...")
 
     # Emit a ready signal so the Swift daemon knows we're initialized
-    ready_msg = json.dumps({"status": "ready", "model": args.model})
-    sys.stdout.write(ready_msg + "\n")
-    sys.stdout.flush()
+    emit([{"status": "ready", "model": args.model}])
+
+    stream_file = open_stream_transcript(args.output_dir, args.meeting_id)
 
     elapsed_seconds = 0.0
     previous_text = ""
+    # Rebuilt only when a chunk produces new text, not on every chunk
+    initial_prompt = build_prompt(args.vocab_prompt, previous_text)
 
     while True:
-        audio = read_pcm_stdin(args.buffer_seconds)
-        if audio is None:
+        chunk = read_pcm_stdin(args.buffer_seconds)
+        if chunk is None:
             log.info("EOF on stdin, exiting")
             break
+        audio, is_silent = chunk
 
         chunk_start = elapsed_seconds
         chunk_end = elapsed_seconds + args.buffer_seconds
         elapsed_seconds = chunk_end
 
         # Skip silence: if RMS is very low, don't bother transcribing
-        rms = np.sqrt(np.mean(audio**2))
-        if rms < 0.005:
+        if is_silent:
+            persist(stream_file, [{"gap": [round(chunk_start, 2), round(chunk_end, 2)],
+                                   "reason": "silent"}])
             continue
 
-        # Build initial_prompt for cross-chunk continuity
-        initial_prompt = ""
-        if args.vocab_prompt:
-            initial_prompt = args.vocab_prompt
-        if previous_text:
-            # Append last segment's text for context (truncate to avoid token limit)
-            prompt_suffix = previous_text[-200:]
-            initial_prompt = f"{initial_prompt} {prompt_suffix}".strip()
-
         try:
-            result = mlx_whisper.transcribe(
-                audio,
-                path_or_hf_repo=args.model,
-                language=args.language,
-                # VoiceInk quality parameters
-                temperature=0.2,
-                condition_on_previous_text=False,
-                no_speech_threshold=0.6,
-                hallucination_silence_threshold=0.5,
-                word_timestamps=True,
-                initial_prompt=initial_prompt if initial_prompt else None,
-                verbose=False,
-            )
+            result = transcribe_chunk(audio, args.model, args.language, initial_prompt)
         except Exception:
             log.exception("Transcription error on chunk at %.1fs", chunk_start)
+            persist(stream_file, [{"gap": [round(chunk_start, 2), round(chunk_end, 2)],
+                                   "reason": "error"}])
             continue
 
         segments = result.get("segments", [])
+        lines = []
+        records = []
         for seg in segments:
             text = seg.get("text", "").strip()
             if not text:
@@ -153,15 +304,36 @@ def main():
                 "no_speech_prob": round(no_speech, 3),
                 "is_final": False,
             }
-            sys.stdout.write(json.dumps(output) + "\n")
-            sys.stdout.flush()
+            lines.append(output)
+
+            if stream_file is not None:
+                records.append({
+                    **output,
+                    "avg_logprob": round(seg.get("avg_logprob", 0.0), 3),
+                    "words": [
+                        {
+                            "word": w["word"],
+                            "start": round(chunk_start + w["start"], 2),
+                            "end": round(chunk_start + w["end"], 2),
+                        }
+                        for w in seg.get("words", [])
+                    ],
+                })
 
             previous_text = text
 
+        emit(lines)
+        persist(stream_file, records)
+
+        if lines:
+            initial_prompt = build_prompt(args.vocab_prompt, previous_text)
+
     # Signal completion
-    done_msg = json.dumps({"status": "done", "total_seconds": round(elapsed_seconds, 1)})
-    sys.stdout.write(done_msg + "\n")
-    sys.stdout.flush()
+    done = {"status": "done", "total_seconds": round(elapsed_seconds, 1)}
+    emit([done])
+    persist(stream_file, [done])
+    if stream_file is not None:
+        stream_file.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,62 @@
+"""Shared MLX Whisper model loading for the recorder's Python scripts.
+
+mlx_whisper.transcribe() resolves its model through ModelHolder, a
+process-wide single-slot cache keyed by repo path. Loading through here
+seeds that cache once per process — optionally with quantized weights — so
+every later transcribe() call with the same path_or_hf_repo reuses it.
+"""
+
+import logging
+
+log = logging.getLogger(__name__)
+
+QUANTIZE_CHOICES = ("none", "int8", "int4")
+QUANTIZE_BITS = {"int8": 8, "int4": 4}
+QUANTIZE_GROUP_SIZE = 64
+
+# (path_or_hf_repo, quantize) of the model currently seeded into ModelHolder
+_loaded: tuple[str, str] | None = None
+
+
+def load_whisper_model(path_or_hf_repo: str, quantize: str = "none"):
+    """Load an MLX Whisper model once and register it for transcribe().
+
+    quantize: "none" keeps fp16 weights; "int8"/"int4" quantize the linear
+    and embedding layers at load time (group size 64). Repos that already
+    ship quantized weights are left as-is.
+    """
+    global _loaded
+
+    import mlx.core as mx
+    import mlx.nn as nn
+    from mlx_whisper.load_models import load_model
+    from mlx_whisper.transcribe import ModelHolder
+
+    if (
+        _loaded == (path_or_hf_repo, quantize)
+        and ModelHolder.model is not None
+        and ModelHolder.model_path == path_or_hf_repo
+    ):
+        return ModelHolder.model
+
+    # transcribe() decodes in fp16 by default, so load weights to match
+    model = load_model(path_or_hf_repo, dtype=mx.float16)
+
+    bits = QUANTIZE_BITS.get(quantize)
+    if bits is not None:
+        nn.quantize(
+            model,
+            group_size=QUANTIZE_GROUP_SIZE,
+            bits=bits,
+            class_predicate=lambda _, m: (
+                isinstance(m, (nn.Linear, nn.Embedding))
+                and m.weight.shape[-1] % QUANTIZE_GROUP_SIZE == 0
+            ),
+        )
+        mx.eval(model.parameters())
+        log.info("Quantized %s to %s", path_or_hf_repo, quantize)
+
+    ModelHolder.model = model
+    ModelHolder.model_path = path_or_hf_repo
+    _loaded = (path_or_hf_repo, quantize)
+    return model
@@ -11,25 +11,63 @@ import requests
 BINARY = os.path.join(
     os.path.dirname(__file__), "..", ".build", "debug", "meeting-recorder"
 )
-BASE_URL = "http://localhost:9847"
 
+# Under pytest-xdist each worker (gw0, gw1, ...) runs its own daemon on its
+# own port. Set here, before test modules import, so they read the same port.
+# Run in parallel with: pytest -n auto --dist loadgroup
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+PORT = 9847 + int(_WORKER.removeprefix("gw"))
+os.environ["CLAUDIA_PORT"] = str(PORT)
+BASE_URL = f"http://localhost:{PORT}"
 
-@pytest.fixture(scope="module")
-def daemon():
-    """Start a meeting-recorder daemon for integration tests.
 
-    Ensures any stale daemon is killed first, starts a fresh one,
-    waits for it to become healthy, and tears it down after tests.
+# Test classes that spawn extra daemons run after everything else, so a
+# misbehaving second daemon can't disturb the shared one mid-suite
+RUN_LAST = {"TestStaleProcessDetection"}
+
+
+def pytest_configure(config):
+    # Registered here so the marker is known even without pytest-xdist
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run all tests in the group on one xdist worker"
+    )
+    config.addinivalue_line(
+        "markers", "fresh_daemon: restart the shared daemon before this test"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    # Stable sort: definition order is kept within each group, since some
+    # tests (e.g. the stale-process pair) depend on running in order
+    items.sort(key=lambda item: item.cls is not None and item.cls.__name__ in RUN_LAST)
+
+
+@pytest.fixture(scope="session")
+def http():
+    """One requests.Session shared by all tests.
+
+    The daemon answers JSON requests with Connection: close, so today each
+    call still opens a new socket; the pool only pays off if the server ever
+    keeps connections alive.
     """
+    session = requests.Session()
+    session.mount(
+        "http://",
+        requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=0),
+    )
+    yield session
+    session.close()
+
+
+def _start_daemon(http):
+    """Kill any stale daemon on PORT, start a fresh one and wait for /health."""
     # Kill any existing daemon on the port
     try:
-        resp = requests.get(f"{BASE_URL}/health", timeout=1)
+        resp = http.get(f"{BASE_URL}/health", timeout=1)
         if resp.ok:
             # Something is already on the port — kill it
-            import subprocess as sp
-
-            pids = sp.check_output(
-                ["lsof", "-ti:9847"], text=True
+            pids = subprocess.check_output(
+                ["lsof", f"-ti:{PORT}"], text=True
             ).strip().split("\n")
             for pid in pids:
                 if pid.strip():
@@ -39,29 +77,32 @@ def daemon():
         pass  # Nothing running, good
 
     proc = subprocess.Popen(
-        [BINARY],
+        [BINARY, "--port", str(PORT)],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
     )
 
-    # Wait for daemon to become healthy
-    for _ in range(20):
+    # Wait for daemon to become healthy, polling often so startup
+    # finishes as soon as the port is up
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
         try:
-            resp = requests.get(f"{BASE_URL}/health", timeout=1)
-            if resp.ok:
+            if http.get(f"{BASE_URL}/health", timeout=1).ok:
                 break
         except requests.ConnectionError:
             pass
-        time.sleep(0.5)
+        time.sleep(0.05)
     else:
         proc.kill()
         raise RuntimeError("Daemon failed to start within 10 seconds")
 
-    yield proc
+    return proc
 
-    # Teardown: stop any active recording, then kill
+
+def _stop_daemon(proc, http):
+    """Stop any active recording, then terminate the daemon."""
     try:
-        requests.post(f"{BASE_URL}/stop", json={"meetingId": "cleanup"}, timeout=2)
+        http.post(f"{BASE_URL}/stop", json={"meetingId": "cleanup"}, timeout=2)
     except Exception:
         pass
     proc.terminate()
@@ -70,3 +111,24 @@ def daemon():
     except subprocess.TimeoutExpired:
         proc.kill()
         proc.wait()
+
+
+@pytest.fixture(scope="session")
+def _daemon_session(http):
+    """Holder for the session's daemon process, replaced on fresh_daemon."""
+    handle = {"proc": _start_daemon(http)}
+    yield handle
+    _stop_daemon(handle["proc"], http)
+
+
+@pytest.fixture
+def daemon(request, _daemon_session, http):
+    """The meeting-recorder daemon for integration tests.
+
+    One daemon serves the whole session; tests clean up their own
+    recordings. Tests marked fresh_daemon get it restarted first.
+    """
+    if request.node.get_closest_marker("fresh_daemon"):
+        _stop_daemon(_daemon_session["proc"], http)
+        _daemon_session["proc"] = _start_daemon(http)
+    return _daemon_session["proc"]
@@ -1,7 +1,9 @@
 """Tests for audio loading in the post-processing pipeline.
 
 Bug 2: pyannote can't load WAV files because torchcodec/FFmpeg is broken.
-Fix: pre-load audio with scipy and pass waveform dict to pyannote.
+Fix: pre-load audio with soundfile (falling back to a memory-mapped
+scipy.io.wavfile read), downmix to mono and resample to 16kHz, then pass the
+waveform dict to pyannote.
 """
 
 import tempfile
@@ -68,6 +70,33 @@ class TestLoadAudio:
         # ~32000 samples for 2s at 16kHz
         assert abs(waveform.shape[1] - 32000) < 100
 
+    def test_load_audio_downmixes_and_resamples(self, tmp_path):
+        """Stereo 44.1kHz input should come back as 16kHz mono."""
+        wav_path = str(tmp_path / "stereo.wav")
+        n_samples = 44100
+        t = np.linspace(0, 1.0, n_samples, endpoint=False)
+        tone = (np.sin(2 * np.pi * 440 * t) * 16000).astype(np.int16)
+        with wave.open(wav_path, "wb") as wf:
+            wf.setnchannels(2)
+            wf.setsampwidth(2)
+            wf.setframerate(44100)
+            wf.writeframes(np.column_stack([tone, tone]).tobytes())
+
+        import sys
+        import os
+        scripts_dir = os.path.join(os.path.dirname(__file__), "..", "scripts")
+        sys.path.insert(0, scripts_dir)
+
+        from postprocess import load_audio
+
+        result = load_audio(wav_path)
+        waveform = result["waveform"]
+
+        assert result["sample_rate"] == 16000
+        assert waveform.shape[0] == 1, f"Expected mono, got {waveform.shape[0]} channels"
+        assert abs(waveform.shape[1] - 16000) < 10
+        assert str(waveform.dtype) == "torch.float32"
+
     def test_run_diarization_uses_load_audio(self, tmp_path):
         """run_diarization should use load_audio instead of passing file path directly."""
         wav_path = str(tmp_path / "test.wav")
@@ -130,3 +159,86 @@ class TestDiarizationFallback:
             result = postprocess.run_diarization(wav_path)
 
         assert result == [], f"Expected empty list on runtime error, got {result}"
+
+
+class TestDiarizationSpeakerHint:
+    """A known attendee count should bound pyannote's speaker search."""
+
+    def _run_with_mock_pipeline(self, tmp_path, **kwargs):
+        import sys
+        import os
+        scripts_dir = os.path.join(os.path.dirname(__file__), "..", "scripts")
+        if scripts_dir not in sys.path:
+            sys.path.insert(0, scripts_dir)
+        import postprocess
+
+        wav_path = str(tmp_path / "test.wav")
+        create_test_wav(wav_path, duration=1.0)
+
+        mock_pipeline = MagicMock()
+        mock_pipeline.return_value.speaker_diarization.itertracks.return_value = []
+        fake_pyannote = {"pyannote": MagicMock(), "pyannote.audio": MagicMock()}
+        with patch.dict(sys.modules, fake_pyannote), patch.object(
+            postprocess, "_load_diarization_pipeline", return_value=mock_pipeline
+        ):
+            postprocess.run_diarization(wav_path, **kwargs)
+        return mock_pipeline
+
+    def test_max_speakers_passed_to_pipeline(self, tmp_path):
+        """max_speakers should be forwarded to the pipeline call."""
+        pipeline = self._run_with_mock_pipeline(tmp_path, max_speakers=2)
+        assert pipeline.call_args.kwargs == {"max_speakers": 2}
+
+    def test_no_hint_when_attendees_unknown(self, tmp_path):
+        """Without a hint, pyannote should estimate the speaker count itself."""
+        pipeline = self._run_with_mock_pipeline(tmp_path)
+        assert pipeline.call_args.kwargs == {}
+
+    def test_hint_leaves_headroom_and_skips_groups(self):
+        """The cap allows extra voices, and groups or rooms remove it."""
+        import sys
+        import os
+        scripts_dir = os.path.join(os.path.dirname(__file__), "..", "scripts")
+        if scripts_dir not in sys.path:
+            sys.path.insert(0, scripts_dir)
+        import postprocess
+
+        assert postprocess.speaker_count_hint([]) is None
+        assert postprocess.speaker_count_hint(["Alice", "Bob"]) == 3 + postprocess.SPEAKER_HINT_HEADROOM
+        assert postprocess.speaker_count_hint(["Tom Allen"]) is not None
+        assert postprocess.speaker_count_hint(["Alice", "Eng Team"]) is None
+        assert postprocess.speaker_count_hint(["Alice", "Conf Room 4B"]) is None
+        assert postprocess.speaker_count_hint(["c_1@resource.calendar.google.com"]) is None
+
+
+class TestDiarizationTurnMerging:
+    """Short same-speaker gaps should be collapsed before turns are emitted."""
+
+    def test_turns_come_from_supported_annotation(self, tmp_path):
+        """run_diarization should iterate the support()-merged annotation."""
+        import sys
+        import os
+        scripts_dir = os.path.join(os.path.dirname(__file__), "..", "scripts")
+        if scripts_dir not in sys.path:
+            sys.path.insert(0, scripts_dir)
+        import postprocess
+
+        wav_path = str(tmp_path / "test.wav")
+        create_test_wav(wav_path, duration=1.0)
+
+        turn = MagicMock(start=0.0, end=2.5)
+        annotation = MagicMock()
+        merged = annotation.support.return_value
+        merged.itertracks.return_value = [(turn, "A", "SPEAKER_00")]
+
+        mock_pipeline = MagicMock()
+        mock_pipeline.return_value.speaker_diarization = annotation
+        fake_pyannote = {"pyannote": MagicMock(), "pyannote.audio": MagicMock()}
+        with patch.dict(sys.modules, fake_pyannote), patch.object(
+            postprocess, "_load_diarization_pipeline", return_value=mock_pipeline
+        ):
+            result = postprocess.run_diarization(wav_path)
+
+        annotation.support.assert_called_once_with(collar=0.5)
+        annotation.itertracks.assert_not_called()
+        assert result == [{"start": 0.0, "end": 2.5, "speaker": "SPEAKER_00"}]
@@ -1,31 +1,124 @@
 """Integration tests for the meeting-recorder HTTP API.
 
-Tests Bug 1 (stale process detection) and Bug 3 (attendees optional).
+Tests Bug 1 (stale process detection), Bug 3 (attendees optional) and the
+/live SSE endpoint.
 """
 
-import glob
 import json
 import os
-import signal
 import subprocess
-import threading
 import time
 
 import pytest
-import requests
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 BINARY = os.path.join(
     os.path.dirname(__file__), "..", ".build", "debug", "meeting-recorder"
 )
-BASE_URL = "http://localhost:9847"
+# Per-worker port chosen by conftest.py (9847 when not running under xdist)
+PORT = int(os.environ.get("CLAUDIA_PORT", "9847"))
+BASE_URL = f"http://localhost:{PORT}"
+RECORDINGS_DIR = os.path.expanduser("~/.config/claudia/recordings")
+
+
+def wait_until(pred, timeout=5.0, interval=0.05):
+    """Poll pred until it returns something truthy or timeout elapses.
+
+    Returns pred's last result, so callers can assert on it directly.
+    """
+    t0 = time.monotonic()
+    while time.monotonic() - t0 < timeout:
+        result = pred()
+        if result:
+            return result
+        time.sleep(interval)
+    return pred()
+
+
+def sse_lines(resp):
+    """Yield raw SSE lines (with line endings) until the stream closes.
+
+    Reads resp.raw directly with read1(), which returns whatever the socket
+    has (up to 4 KiB). The sized reads behind iter_content/iter_lines block
+    until a full chunk arrives, which on a stream that stays open can hold a
+    short event back until the timeout; raw.readline() goes a byte at a time.
+    """
+    raw = resp.raw
+    raw.decode_content = True
+    buf = bytearray()
+    while True:
+        chunk = raw.read1(4096)
+        if not chunk:
+            if buf:
+                yield bytes(buf)
+            return
+        buf += chunk
+        start = 0
+        while (end := buf.find(b"\n", start)) != -1:
+            yield bytes(buf[start:end + 1])
+            start = end + 1
+        del buf[:start]
+
+
+def find_live_files(directory, meeting_id):
+    """Paths of persisted -live.json transcripts for meeting_id in directory.
+
+    One scandir pass; glob would also lstat every match.
+    """
+    prefix = f"meeting-{meeting_id}-"
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                e.path for e in entries
+                if e.name.startswith(prefix) and e.name.endswith("-live.json")
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def read_live_summary(path):
+    """meetingId and which top-level sections a -live.json file has.
+
+    With ijson the file is parsed as a stream and reading stops once all
+    three are found, so the segments array is never materialized.
+    """
+    if ijson is None:
+        with open(path) as f:
+            data = json.load(f)
+        return {
+            "meetingId": data.get("meetingId"),
+            "finalMetrics": "finalMetrics" in data,
+            "segments": "segments" in data,
+        }
+
+    found = {"meetingId": None, "finalMetrics": False, "segments": False}
+    with open(path, "rb") as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == "meetingId" and event == "string":
+                found["meetingId"] = value
+            elif prefix == "finalMetrics" and event == "start_map":
+                found["finalMetrics"] = True
+            elif prefix == "segments" and event == "start_array":
+                found["segments"] = True
+            if found["meetingId"] is not None and found["finalMetrics"] and found["segments"]:
+                break
+    return found
+
+
+def is_idle(http):
+    return http.get(f"{BASE_URL}/status", timeout=2).json().get("recording") is False
 
 
 class TestAttendeesOptional:
     """Bug 3: POST /start should accept requests without the attendees field."""
 
-    def test_start_without_attendees(self, daemon):
+    def test_start_without_attendees(self, daemon, http):
         """Omitting attendees entirely should succeed."""
-        resp = requests.post(
+        resp = http.post(
             f"{BASE_URL}/start",
             json={"meetingId": "test-no-attendees", "title": "Test"},
         )
@@ -34,16 +127,16 @@ class TestAttendeesOptional:
         assert data.get("started") is True
 
         # Cleanup
-        requests.post(
+        http.post(
             f"{BASE_URL}/stop",
             json={"meetingId": "test-no-attendees"},
             timeout=10,
         )
-        time.sleep(1)
+        wait_until(lambda: is_idle(http))
 
-    def test_start_with_empty_attendees_still_works(self, daemon):
+    def test_start_with_empty_attendees_still_works(self, daemon, http):
         """Explicit empty attendees should still work (regression check)."""
-        resp = requests.post(
+        resp = http.post(
             f"{BASE_URL}/start",
             json={
                 "meetingId": "test-empty-attendees",
@@ -56,23 +149,28 @@ class TestAttendeesOptional:
         assert data.get("started") is True
 
         # Cleanup
-        requests.post(
+        http.post(
             f"{BASE_URL}/stop",
             json={"meetingId": "test-empty-attendees"},
             timeout=10,
         )
-        time.sleep(1)
+        wait_until(lambda: is_idle(http))
 
 
+@pytest.mark.xdist_group("stale")
 class TestStaleProcessDetection:
     """Bug 1: Starting a second daemon should fail fast, not hang."""
 
     def test_second_daemon_exits_nonzero(self, daemon):
         """A second daemon on the same port should exit with a non-zero code."""
+        # Only the exit code matters, so skip the pipes. close_fds=False lets
+        # CPython use posix_spawn instead of fork+exec; the child inherits
+        # our open fds, which is harmless for a process expected to exit.
         proc2 = subprocess.Popen(
-            [BINARY],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            [BINARY, "--port", str(PORT)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
         )
         try:
             proc2.wait(timeout=10)
@@ -85,9 +183,9 @@ class TestStaleProcessDetection:
             f"Second daemon should exit non-zero, got {proc2.returncode}"
         )
 
-    def test_original_daemon_still_healthy(self, daemon):
+    def test_original_daemon_still_healthy(self, daemon, http):
         """After a second daemon fails to start, the original should still work."""
-        resp = requests.get(f"{BASE_URL}/health", timeout=2)
+        resp = http.get(f"{BASE_URL}/health", timeout=2)
         assert resp.ok
         assert resp.json().get("ok") is True
 
@@ -95,92 +193,84 @@ class TestStaleProcessDetection:
 class TestSSELiveEndpoint:
     """GET /live should stream Server-Sent Events."""
 
-    def test_live_returns_sse_headers(self, daemon):
+    def test_live_returns_sse_headers(self, daemon, http):
         """GET /live should return text/event-stream content type."""
-        resp = requests.get(f"{BASE_URL}/live", stream=True, timeout=5)
+        resp = http.get(f"{BASE_URL}/live", stream=True, timeout=5)
         assert resp.status_code == 200
         assert "text/event-stream" in resp.headers.get("Content-Type", "")
         resp.close()
 
-    def test_live_idle_when_not_recording(self, daemon):
+    def test_live_idle_when_not_recording(self, daemon, http):
         """When not recording, /live should send a status:idle event."""
-        resp = requests.get(f"{BASE_URL}/live", stream=True, timeout=5)
-        # Read first event
-        first_line = b""
-        for chunk in resp.iter_content(chunk_size=1):
-            first_line += chunk
-            if b"\n\n" in first_line:
+        resp = http.get(f"{BASE_URL}/live", stream=True, timeout=5)
+        # Read first event: lines up to the blank line that terminates it
+        first_event = b""
+        for line in sse_lines(resp):
+            first_event += line
+            if not line.strip():
                 break
         resp.close()
 
-        text = first_line.decode("utf-8")
+        text = first_event.decode("utf-8")
         assert "event: status" in text
         assert '"idle"' in text
 
-    def test_live_streams_segments_during_recording(self, daemon):
+    def test_live_streams_segments_during_recording(self, daemon, http):
         """Start a recording, connect to /live, verify segment events arrive."""
         # Start recording
-        start_resp = requests.post(
+        start_resp = http.post(
             f"{BASE_URL}/start",
             json={"meetingId": "sse-test", "title": "SSE Test"},
         )
         assert start_resp.status_code == 200
 
+        # Read /live on this thread until the status event arrives. The read
+        # timeout bounds each blocking read and the deadline bounds the total.
         events = []
-        stop_flag = threading.Event()
-
-        def collect_events():
-            try:
-                resp = requests.get(f"{BASE_URL}/live", stream=True, timeout=15)
-                for line in resp.iter_lines():
-                    if stop_flag.is_set():
-                        break
-                    if line:
-                        events.append(line.decode("utf-8"))
-                resp.close()
-            except Exception:
-                pass
-
-        # Collect SSE events in background
-        t = threading.Thread(target=collect_events, daemon=True)
-        t.start()
-
-        # Wait a bit for events to accumulate, then stop
-        time.sleep(8)
-        requests.post(f"{BASE_URL}/stop", json={"meetingId": "sse-test"}, timeout=10)
-        time.sleep(2)
-        stop_flag.set()
-        t.join(timeout=5)
+        deadline = time.monotonic() + 10
+        resp = http.get(f"{BASE_URL}/live", stream=True, timeout=(5, 10))
+        try:
+            for line in sse_lines(resp):
+                line = line.rstrip(b"\r\n")
+                if line:
+                    events.append(line.decode("utf-8"))
+                if line.startswith(b"event: status") or time.monotonic() > deadline:
+                    break
+        except Exception:
+            pass
+        finally:
+            resp.close()
+
+        http.post(f"{BASE_URL}/stop", json={"meetingId": "sse-test"}, timeout=10)
+        wait_until(lambda: is_idle(http))
 
         # Should have received at least a status event
         event_text = "\n".join(events)
         assert "event: status" in event_text, f"Expected status event, got: {event_text}"
 
-    def test_live_persists_on_stop(self, daemon):
+    def test_live_persists_on_stop(self, daemon, http):
         """After stop, a -live.json file should be written."""
-        recordings_dir = os.path.expanduser("~/.config/claudia/recordings")
-
         # Clean up any stale files from previous runs
-        for f in glob.glob(f"{recordings_dir}/meeting-persist-test-*-live.json"):
+        for f in find_live_files(RECORDINGS_DIR, "persist-test"):
             os.remove(f)
 
         # Start and stop a recording
-        start_resp = requests.post(
+        start_resp = http.post(
             f"{BASE_URL}/start",
             json={"meetingId": "persist-test", "title": "Persist Test"},
         )
         assert start_resp.status_code == 200, f"Start failed: {start_resp.text}"
-        time.sleep(3)
-        requests.post(f"{BASE_URL}/stop", json={"meetingId": "persist-test"}, timeout=10)
-        time.sleep(2)
+        wait_until(
+            lambda: http.get(f"{BASE_URL}/status", timeout=2).json().get("recording") is True
+        )
+        http.post(f"{BASE_URL}/stop", json={"meetingId": "persist-test"}, timeout=10)
 
         # Check for live JSON file
-        live_files = glob.glob(f"{recordings_dir}/meeting-persist-test-*-live.json")
+        live_files = wait_until(lambda: find_live_files(RECORDINGS_DIR, "persist-test"))
         assert len(live_files) >= 1, f"Expected live JSON file, found: {live_files}"
 
         # Verify contents
-        with open(live_files[0]) as f:
-            data = json.load(f)
-        assert data["meetingId"] == "persist-test"
-        assert "finalMetrics" in data
-        assert "segments" in data
+        summary = read_live_summary(live_files[0])
+        assert summary["meetingId"] == "persist-test"
+        assert summary["finalMetrics"]
+        assert summary["segments"]
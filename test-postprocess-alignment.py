@@ -116,10 +116,33 @@ def test_nearest_speaker_fallback():
     print("PASS: nearest speaker fallback works in gaps")
 
 
+def test_unsorted_overlapping_turns():
+    """Turn lookup must not depend on diarization output being sorted, and
+    equal overlaps resolve to the earliest-listed turn."""
+    speaker_segments = [
+        {"start": 6.0, "end": 9.0, "speaker": "SPEAKER_C"},
+        {"start": 0.0, "end": 4.0, "speaker": "SPEAKER_A"},
+        {"start": 1.0, "end": 3.0, "speaker": "SPEAKER_B"},
+    ]
+    whisper_result = {
+        "segments": [
+            # Fully inside both A and B → equal overlap, A listed first
+            {"start": 1.5, "end": 2.5, "text": "overlap"},
+            # Gap word nearest to C's start (0.5s away)
+            {"start": 5.4, "end": 5.6, "text": "gap"},
+            {"start": 7.0, "end": 8.0, "text": "late"},
+        ]
+    }
+    result = align_transcript_with_speakers(whisper_result, speaker_segments)
+    assert [s["speaker"] for s in result] == ["SPEAKER_A", "SPEAKER_C"], result
+    print("PASS: unsorted/overlapping turns resolve consistently")
+
+
 if __name__ == "__main__":
     test_overlap_weighted_beats_midpoint()
     test_no_diarization_fallback()
     test_merge_consecutive_same_speaker()
     test_no_merge_across_speakers()
     test_nearest_speaker_fallback()
+    test_unsorted_overlapping_turns()
     print("\nAll postprocess alignment tests passed.")
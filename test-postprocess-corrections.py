@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Tests for batched dictionary corrections in postprocess.py."""
+
+import sys
+import os
+import re
+import logging
+import tempfile
+import types
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "recorder", "scripts"))
+import postprocess
+from postprocess import SEGMENT_SEPARATOR, apply_corrections
+
+
+class FakeCorrector:
+    """Regex find/replace rules, counting replacements like DictionaryCorrector."""
+
+    def __init__(self, rules: list[tuple[str, str]]):
+        self.rules = rules
+        self.calls = []
+
+    def correct(self, text: str):
+        self.calls.append(text)
+        total = 0
+        for pattern, new in self.rules:
+            text, count = re.subn(pattern, new, text)
+            total += count
+        return text, types.SimpleNamespace(total_replacements=total)
+
+
+class LogCapture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def run_corrections(texts: list[str], rules: list[tuple[str, str]]):
+    """apply_corrections over texts with a fake corrector; returns
+    (corrected texts, corrector, log messages)."""
+    corrector = FakeCorrector(rules)
+    segments = [{"start": float(i), "end": i + 1.0, "text": t, "speaker": "A"}
+                for i, t in enumerate(texts)]
+
+    fake_module = types.ModuleType("video_transcription.corrector")
+    fake_module.DictionaryCorrector = FakeCorrector
+    saved_modules = {k: sys.modules.get(k)
+                     for k in ("video_transcription", "video_transcription.corrector")}
+    sys.modules["video_transcription"] = types.ModuleType("video_transcription")
+    sys.modules["video_transcription.corrector"] = fake_module
+
+    saved_path, saved_loader = postprocess.CORRECTIONS_PATH, postprocess._load_corrector
+    capture = LogCapture()
+    saved_level = postprocess.log.level
+    postprocess.log.addHandler(capture)
+    postprocess.log.setLevel(logging.INFO)
+    with tempfile.NamedTemporaryFile("w", suffix=".yaml") as f:
+        f.writelines(f"'{pattern}': '{new}'\n" for pattern, new in rules)
+        f.flush()
+        postprocess.CORRECTIONS_PATH = Path(f.name)
+        postprocess._load_corrector = lambda path, mtime: corrector
+        try:
+            result = apply_corrections(segments)
+        finally:
+            postprocess.CORRECTIONS_PATH, postprocess._load_corrector = saved_path, saved_loader
+            postprocess.log.removeHandler(capture)
+            postprocess.log.setLevel(saved_level)
+            for name, module in saved_modules.items():
+                if module is None:
+                    sys.modules.pop(name, None)
+                else:
+                    sys.modules[name] = module
+
+    return [seg["text"] for seg in result], corrector, capture.messages
+
+
+def per_segment_total(texts, rules) -> int:
+    corrector = FakeCorrector(rules)
+    return sum(corrector.correct(t)[1].total_replacements for t in texts)
+
+
+def test_batched_corrections_land_in_the_right_segments():
+    """One corrector call; each segment gets only its own corrections."""
+    texts = ["we use kuber netes", "no changes here", "kuber netes and clawd", "clawd"]
+    rules = [("kuber netes", "Kubernetes"), ("clawd", "Claudia")]
+    corrected, corrector, messages = run_corrections(texts, rules)
+
+    assert corrected == ["we use Kubernetes", "no changes here",
+                         "Kubernetes and Claudia", "Claudia"], corrected
+    assert len(corrector.calls) == 1, corrector.calls
+    assert f"Applied {per_segment_total(texts, rules)} dictionary corrections" in messages
+    print("PASS: batched corrections land in the right segments")
+
+
+def test_rule_eating_separator_falls_back_per_segment():
+    """If a rule consumes SEGMENT_SEPARATOR, segments are corrected one by one."""
+    texts = ["the end", "start again", "clawd here"]
+    rules = [("end" + SEGMENT_SEPARATOR + "start", "end start"), ("clawd", "Claudia")]
+    corrected, corrector, messages = run_corrections(texts, rules)
+
+    assert corrected == ["the end", "start again", "Claudia here"], corrected
+    assert corrector.calls[1:] == texts, corrector.calls
+    total = per_segment_total(texts, rules)
+    assert total == 1
+    assert f"Applied {total} dictionary corrections" in messages, messages
+    print("PASS: separator-eating rule falls back to per-segment correction")
+
+
+def test_anchored_rules_are_applied_per_segment():
+    """^/$ rules must see every segment, not just the ends of a joined pass."""
+    texts = ["um so we start", "um next point", "clawd is done"]
+    rules = [("^um ", ""), ("clawd", "Claudia")]
+    corrected, corrector, messages = run_corrections(texts, rules)
+
+    assert corrected == ["so we start", "next point", "Claudia is done"], corrected
+    assert corrector.calls == texts, corrector.calls
+    assert f"Applied {per_segment_total(texts, rules)} dictionary corrections" in messages
+    print("PASS: anchored rules are applied per segment")
+
+
+if __name__ == "__main__":
+    test_batched_corrections_land_in_the_right_segments()
+    test_rule_eating_separator_falls_back_per_segment()
+    test_anchored_rules_are_applied_per_segment()
+    print("\nAll postprocess correction tests passed.")
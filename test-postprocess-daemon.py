@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Tests for the postprocess.py --daemon stdin/stdout job protocol."""
+
+import sys
+import os
+import io
+import json
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "recorder", "scripts"))
+import postprocess
+
+
+def run_daemon_with(jobs: list[str], process_recording) -> tuple[list[dict], list[tuple]]:
+    """Drive run_daemon with jobs on a fake stdin; return output lines and preloads."""
+    args = argparse.Namespace(model="test-model", quantize="none", skip_diarization=False)
+    preloads = []
+
+    def fake_load_whisper_model(model, quantize):
+        preloads.append((model, quantize))
+
+    def failing_diarization_preload():
+        raise OSError("No HuggingFace token found")
+
+    saved = (
+        postprocess.load_whisper_model,
+        postprocess._load_diarization_pipeline,
+        postprocess.process_recording,
+        sys.stdin,
+        sys.stdout,
+    )
+    postprocess.load_whisper_model = fake_load_whisper_model
+    postprocess._load_diarization_pipeline = failing_diarization_preload
+    postprocess.process_recording = process_recording
+    sys.stdin = io.StringIO("".join(line + "\n" for line in jobs))
+    sys.stdout = io.StringIO()
+    try:
+        postprocess.run_daemon(args)
+        output = sys.stdout.getvalue()
+    finally:
+        (
+            postprocess.load_whisper_model,
+            postprocess._load_diarization_pipeline,
+            postprocess.process_recording,
+            sys.stdin,
+            sys.stdout,
+        ) = saved
+
+    return [json.loads(line) for line in output.splitlines()], preloads
+
+
+def test_ready_line_comes_first():
+    """Models are preloaded once and ready is announced before any job."""
+    lines, preloads = run_daemon_with([], lambda *a: None)
+
+    assert lines == [{"status": "ready", "model": "test-model"}], lines
+    assert preloads == [("test-model", "none")], preloads
+    print("PASS: ready line is emitted after preloading")
+
+
+def test_jobs_and_metadata_forms():
+    """Metadata may be an object or a JSON string; silent WAVs map to null."""
+    calls = []
+
+    def fake_process_recording(wav_path, metadata, output_dir, args):
+        calls.append((wav_path, metadata, output_dir))
+        if wav_path == "/tmp/silent.wav":
+            return None
+        return output_dir / "meeting-m-1.json"
+
+    meta = {"meetingId": "m-1", "attendees": ["Alice"]}
+    lines, _ = run_daemon_with([
+        json.dumps({"wav": "/tmp/a.wav", "metadata": meta, "output_dir": "/tmp/out"}),
+        "",
+        json.dumps({"wav": "/tmp/b.wav", "metadata": json.dumps(meta), "output_dir": "/tmp/out"}),
+        json.dumps({"wav": "/tmp/silent.wav", "output_dir": "/tmp/out"}),
+    ], fake_process_recording)
+
+    assert [c[1] for c in calls] == [meta, meta, {}], calls
+    assert all(c[2] == Path("/tmp/out") for c in calls)
+    assert lines[1:] == [
+        {"wav": "/tmp/a.wav", "transcript": "/tmp/out/meeting-m-1.json"},
+        {"wav": "/tmp/b.wav", "transcript": "/tmp/out/meeting-m-1.json"},
+        {"wav": "/tmp/silent.wav", "transcript": None},
+    ], lines
+    print("PASS: jobs with object/string metadata and silent WAVs")
+
+
+def test_bad_jobs_report_errors_and_loop_continues():
+    """A failing job yields {wav, error}; later jobs still run."""
+
+    def fake_process_recording(wav_path, metadata, output_dir, args):
+        if wav_path == "/tmp/broken.wav":
+            raise RuntimeError("decode failed")
+        return output_dir / "ok.json"
+
+    lines, _ = run_daemon_with([
+        "not json",
+        json.dumps({"metadata": {}}),
+        json.dumps({"wav": "/tmp/broken.wav", "output_dir": "/tmp/out"}),
+        json.dumps({"wav": "/tmp/good.wav", "output_dir": "/tmp/out"}),
+    ], fake_process_recording)
+
+    results = lines[1:]
+    assert len(results) == 4, results
+    assert results[0]["wav"] is None and "error" in results[0]
+    assert results[1]["wav"] is None and "error" in results[1]
+    assert results[2] == {"wav": "/tmp/broken.wav", "error": "decode failed"}
+    assert results[3] == {"wav": "/tmp/good.wav", "transcript": "/tmp/out/ok.json"}
+    print("PASS: bad jobs report errors without stopping the daemon")
+
+
+if __name__ == "__main__":
+    test_ready_line_comes_first()
+    test_jobs_and_metadata_forms()
+    test_bad_jobs_report_errors_and_loop_continues()
+    print("\nAll postprocess daemon tests passed.")
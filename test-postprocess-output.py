@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Tests for the incremental transcript writer in postprocess.py."""
+
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "recorder", "scripts"))
+from postprocess import build_output, write_output
+
+
+def reference_json(output: dict) -> str:
+    """What json.dump(indent=2) produced when fullText was built in memory."""
+    full_text = "\n".join(f"[{s['speaker']}] {s['text']}" for s in output["segments"])
+    doc = {}
+    for key, value in output.items():
+        doc[key] = value
+        if key == "segments":
+            doc["fullText"] = full_text
+    return json.dumps(doc, indent=2, ensure_ascii=False)
+
+
+def write_and_read(output: dict) -> str:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "out.json"
+        write_output(path, output)
+        return path.read_text()
+
+
+def test_matches_json_dump_byte_for_byte():
+    """Streamed output must be identical to the old json.dump output."""
+    segments = [
+        {"start": 0.0, "end": 2.5, "text": 'said "hi" \\ bye', "speaker": "Alice"},
+        {"start": 3.0, "end": 4.0, "text": "café déjà vu — 日本語", "speaker": "SPEAKER_01"},
+        {"start": 4.5, "end": 6.0, "text": "tab\there", "speaker": "Unknown"},
+    ]
+    speakers = [{"label": "SPEAKER_01", "name": "SPEAKER_01", "confidence": 0.42}]
+    metadata = {"meetingId": "m-1", "title": "Sync", "attendees": ["Alice", "Bob"]}
+    output = build_output(segments, speakers, metadata, "/tmp/m-1.wav", "whisper")
+
+    assert write_and_read(output) == reference_json(output)
+    print("PASS: streamed output matches json.dump")
+
+
+def test_empty_transcript():
+    """No segments → empty list and empty fullText, still valid JSON."""
+    output = build_output([], [], {}, "/tmp/empty.wav", "whisper")
+    text = write_and_read(output)
+
+    assert text == reference_json(output)
+    data = json.loads(text)
+    assert data["segments"] == []
+    assert data["fullText"] == ""
+    print("PASS: empty transcript writes valid JSON")
+
+
+if __name__ == "__main__":
+    test_matches_json_dump_byte_for_byte()
+    test_empty_transcript()
+    print("\nAll postprocess output tests passed.")
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Tests for batched speaker identification in postprocess.py."""
+
+import sys
+import os
+import tempfile
+
+import numpy as np
+import torch
+from scipy.io import wavfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "recorder", "scripts"))
+import postprocess
+from postprocess import _cosine_similarity_matrix, identify_speakers
+
+RATE = 16000
+
+# Cluster embeddings the stub encoder returns, keyed by the clip's level
+CLOSE_TO_ALICE = [0.9, 0.1, 0.0]
+NEAR_BOB = [0.0, 0.6, 0.8]  # best match Bob at 0.6, under the 0.65 threshold
+
+KNOWN = [
+    {"name": "Alice", "embedding": [1.0, 0.0, 0.0]},
+    {"name": "Bob", "embedding": [0.0, 1.0, 0.0]},
+    {"name": "Carol", "embedding": [0.6, 0.8, 0.0]},  # also above threshold for Alice's voice
+    {"name": "Ghost", "embedding": [0.0, 0.0, 0.0]},  # zero norm
+]
+
+
+class StubEncoder:
+    """Maps each clip's unpadded mean level to a fixed embedding."""
+
+    def __init__(self):
+        self.wav_lens = None
+
+    def encode_batch(self, batch, wav_lens):
+        self.wav_lens = wav_lens.tolist()
+        rows = []
+        for wav, rel_len in zip(batch, wav_lens):
+            valid = wav[: int(round(float(rel_len) * batch.shape[1]))]
+            level = float(valid.mean())
+            if abs(level - 0.5) < 1e-3:
+                rows.append(CLOSE_TO_ALICE)
+            elif abs(level - 0.2) < 1e-3:
+                rows.append(NEAR_BOB)
+            elif not valid.any():
+                rows.append([0.0, 0.0, 0.0])
+            else:
+                raise AssertionError(f"padding leaked into clip (mean level {level:.3f})")
+        return torch.tensor(rows).unsqueeze(1)  # (batch, 1, dim) like ECAPA
+
+
+def run_identify(segments):
+    """identify_speakers over a 6s test WAV with a stub encoder and known embeddings."""
+    audio = np.zeros(6 * RATE, dtype=np.float32)
+    audio[0:2 * RATE] = 0.5  # SPEAKER_00, 2.0s
+    audio[2 * RATE:int(3.5 * RATE)] = 0.2  # SPEAKER_01, 1.5s (padded in the batch)
+    audio[int(3.5 * RATE):4 * RATE] = 0.5  # SPEAKER_02, 0.5s (too short to embed)
+    # SPEAKER_03, 4-6s, digital silence → zero-norm embedding
+
+    encoder = StubEncoder()
+    saved = (postprocess._fetch_known_embeddings, postprocess._load_speaker_encoder)
+    postprocess._fetch_known_embeddings = lambda url: KNOWN
+    postprocess._load_speaker_encoder = lambda: encoder
+    with tempfile.NamedTemporaryFile(suffix=".wav") as f:
+        wavfile.write(f.name, RATE, (audio * 32767).astype(np.int16))
+        try:
+            result = identify_speakers(segments, f.name, [])
+        finally:
+            postprocess._fetch_known_embeddings, postprocess._load_speaker_encoder = saved
+    return result, encoder
+
+
+def make_segments():
+    spans = [(0.0, 2.0, "SPEAKER_00"), (2.0, 3.5, "SPEAKER_01"),
+             (3.5, 4.0, "SPEAKER_02"), (4.0, 6.0, "SPEAKER_03")]
+    return [{"start": s, "end": e, "text": "hi", "speaker": spk} for s, e, spk in spans]
+
+
+def test_speakers_get_best_match_above_threshold():
+    """argmax picks the closest known speaker; weak matches stay unlabelled."""
+    (segments, info), _ = run_identify(make_segments())
+    by_label = {i["label"]: i for i in info}
+
+    assert segments[0]["speaker"] == "Alice", segments[0]
+    assert by_label["SPEAKER_00"]["confidence"] > 0.9
+    # Bob is the best match but under SIMILARITY_THRESHOLD → unknown speaker
+    assert segments[1]["speaker"] == "SPEAKER_01"
+    assert by_label["SPEAKER_01"] == {"label": "SPEAKER_01", "name": "SPEAKER_01",
+                                      "confidence": 0.6}
+    # Under 1s of audio is never embedded
+    assert by_label["SPEAKER_02"]["confidence"] == 0.0
+    print("PASS: best match above threshold, unknown below it")
+
+
+def test_zero_norm_embeddings_score_zero():
+    """Silent clusters and zero known embeddings give 0, not NaN."""
+    (segments, info), _ = run_identify(make_segments())
+    by_label = {i["label"]: i for i in info}
+    assert segments[3]["speaker"] == "SPEAKER_03"
+    assert by_label["SPEAKER_03"]["confidence"] == 0.0
+
+    sims = _cosine_similarity_matrix([[0.0, 0.0], [3.0, 4.0]], [[1.0, 0.0], [0.0, 0.0]])
+    assert np.array_equal(sims, np.array([[0.0, 0.0], [0.6, 0.0]], dtype=np.float32)), sims
+    print("PASS: zero-norm rows score zero")
+
+
+def test_unequal_clips_are_padded_with_relative_lengths():
+    """Shorter clips are zero-padded and wav_lens marks their real length."""
+    _, encoder = run_identify(make_segments())
+    # Embedded clusters in label order: SPEAKER_00 (2s), SPEAKER_01 (1.5s), SPEAKER_03 (2s)
+    assert encoder.wav_lens == [1.0, 0.75, 1.0], encoder.wav_lens
+    print("PASS: wav_lens marks padding of unequal clips")
+
+
+if __name__ == "__main__":
+    test_speakers_get_best_match_above_threshold()
+    test_zero_norm_embeddings_score_zero()
+    test_unequal_clips_are_padded_with_relative_lengths()
+    print("\nAll postprocess speaker identification tests passed.")
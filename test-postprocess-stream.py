@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Tests for reusing the live stream transcript in postprocess.py."""
+
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "recorder", "scripts"))
+import postprocess
+from postprocess import load_stream_transcript, transcribe_from_stream
+
+
+def write_stream(lines: list[dict]) -> Path:
+    fd, path = tempfile.mkstemp(suffix=".jsonl")
+    with os.fdopen(fd, "w") as f:
+        for line in lines:
+            f.write(json.dumps(line) + "\n")
+    return Path(path)
+
+
+def seg(start, end, text, no_speech=0.05, logprob=-0.2):
+    return {
+        "text": text, "start": start, "end": end,
+        "no_speech_prob": no_speech, "avg_logprob": logprob, "is_final": False,
+        "words": [{"word": " " + text, "start": start, "end": end}],
+    }
+
+
+def run_with_fake_whisper(stream, samples, calls):
+    """transcribe_from_stream with Whisper replaced by a recorder of spans."""
+    rate = postprocess.PIPELINE_SAMPLE_RATE
+
+    def fake_transcribe(wav_path, model, language, quantize="none", samples=None):
+        # samples is a slice of the full array; recover its span in seconds
+        start = (samples.ctypes.data - full.ctypes.data) // full.itemsize / rate
+        calls.append((start, start + len(samples) / rate))
+        return {"segments": [{"start": 0.1, "end": 0.8, "text": "clear words",
+                              "no_speech_prob": 0.1, "words": []}]}
+
+    full = samples
+    original = postprocess.transcribe_audio
+    postprocess.transcribe_audio = fake_transcribe
+    try:
+        return transcribe_from_stream(stream, samples, "model", None)
+    finally:
+        postprocess.transcribe_audio = original
+
+
+def test_complete_stream_is_parsed():
+    """Segment lines become whisper_result segments; gap lines become gaps."""
+    path = write_stream([
+        seg(0.0, 2.0, "hello there"),
+        {"gap": [3.0, 6.0], "reason": "silent"},
+        seg(6.0, 8.0, "general kenobi"),
+        {"status": "done", "total_seconds": 9.0},
+    ])
+    try:
+        result = load_stream_transcript(path)
+    finally:
+        path.unlink()
+
+    assert [s["text"] for s in result["segments"]] == ["hello there", "general kenobi"]
+    assert result["segments"][0]["words"][0]["start"] == 0.0
+    assert result["gaps"] == [{"start": 3.0, "end": 6.0, "reason": "silent"}]
+    assert result["total_seconds"] == 9.0
+    print("PASS: complete stream transcript is parsed")
+
+
+def test_unfinished_stream_is_ignored():
+    """Without the trailing done line the stream may be partial → None."""
+    path = write_stream([seg(0.0, 2.0, "hello there")])
+    try:
+        assert load_stream_transcript(path) is None
+    finally:
+        path.unlink()
+    assert load_stream_transcript(Path("/tmp/nonexistent-stream.jsonl")) is None
+    print("PASS: unfinished or missing stream transcript is ignored")
+
+
+def test_stream_is_shifted_onto_the_wav_timeline():
+    """streamOffsetSeconds moves every time later; the unsent lead is a gap."""
+    path = write_stream([
+        seg(0.0, 2.0, "hello there"),
+        {"gap": [3.0, 6.0], "reason": "silent"},
+        {"status": "done", "total_seconds": 6.0},
+    ])
+    try:
+        result = load_stream_transcript(path, offset=0.25)
+    finally:
+        path.unlink()
+
+    first = result["segments"][0]
+    assert (first["start"], first["end"]) == (0.25, 2.25), first
+    assert first["words"][0]["start"] == 0.25
+    assert result["gaps"] == [
+        {"start": 0.0, "end": 0.25, "reason": "unsent"},
+        {"start": 3.25, "end": 6.25, "reason": "silent"},
+    ], result["gaps"]
+    assert result["total_seconds"] == 6.25
+
+    # A quiet lead is skipped like silence; an audible one is transcribed
+    rate = postprocess.PIPELINE_SAMPLE_RATE
+    samples = np.zeros(7 * rate, dtype=np.float32)
+    calls = []
+    run_with_fake_whisper(result, samples, calls)
+    assert calls == [], calls
+    samples[:rate // 4] = 0.01
+    run_with_fake_whisper(result, samples, calls)
+    assert calls == [(0.0, 0.25)], calls
+    print("PASS: stream transcript is shifted onto the WAV timeline")
+
+
+def test_only_low_confidence_segments_are_retranscribed():
+    """Confident segments are kept; uncertain ones are re-run on their span."""
+    stream = {"segments": [seg(float(i), i + 0.9, f"word{i} ok") for i in range(8)]}
+    stream["segments"][5] = seg(5.0, 6.0, "mumble", no_speech=0.5)
+
+    calls = []
+    samples = np.zeros(10 * postprocess.PIPELINE_SAMPLE_RATE, dtype=np.float32)
+    result = run_with_fake_whisper(stream, samples, calls)
+
+    assert calls == [(5.0, 6.0)], calls
+    texts = [s["text"] for s in result["segments"]]
+    assert texts[5] == "clear words" and texts[4] == "word4 ok", texts
+    assert result["segments"][5]["start"] == 5.1
+    print("PASS: only low-confidence segments are re-transcribed")
+
+
+def test_gaps_are_filled_in():
+    """Error gaps and audible silent gaps are transcribed; true silence is not."""
+    rate = postprocess.PIPELINE_SAMPLE_RATE
+    samples = np.zeros(30 * rate, dtype=np.float32)
+    # Quiet speech under the live 0.005 gate, but above the noise floor
+    samples[9 * rate:12 * rate] = 0.003 * np.sin(np.arange(3 * rate) * 0.1)
+    stream = {
+        "segments": [seg(float(i), i + 0.9, f"word{i} ok") for i in range(0, 30, 3)
+                     if i not in (6, 9, 12)],
+        "gaps": [
+            {"start": 6.0, "end": 9.0, "reason": "silent"},   # digital silence
+            {"start": 9.0, "end": 12.0, "reason": "silent"},  # quiet speech
+            {"start": 12.0, "end": 15.0, "reason": "error"},  # adjacent → merged
+        ],
+        "total_seconds": 30.0,
+    }
+    calls = []
+    result = run_with_fake_whisper(stream, samples, calls)
+
+    assert calls == [(9.0, 15.0)], calls
+    starts = [s["start"] for s in result["segments"]]
+    assert starts == sorted(starts), starts
+    assert 9.1 in starts, starts
+    print("PASS: error and audible silent gaps are re-transcribed")
+
+
+def test_mostly_uncertain_stream_falls_back():
+    """Past the recheck fraction, the caller should run full Whisper."""
+    stream = {"segments": [seg(float(i), i + 0.9, "uh", logprob=-1.5) for i in range(4)]}
+    assert transcribe_from_stream(stream, np.zeros(80000), "model", None) is None
+
+    # Failed chunks count toward the fraction too
+    stream = {
+        "segments": [seg(0.0, 2.0, "hello there")],
+        "gaps": [{"start": 3.0, "end": 9.0, "reason": "error"}],
+        "total_seconds": 9.0,
+    }
+    assert transcribe_from_stream(stream, np.zeros(9 * 16000), "model", None) is None
+    print("PASS: mostly uncertain stream falls back to full transcription")
+
+
+if __name__ == "__main__":
+    test_complete_stream_is_parsed()
+    test_unfinished_stream_is_ignored()
+    test_stream_is_shifted_onto_the_wav_timeline()
+    test_only_low_confidence_segments_are_retranscribed()
+    test_gaps_are_filled_in()
+    test_mostly_uncertain_stream_falls_back()
+    print("\nAll postprocess stream reuse tests passed.")
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Tests for stream_transcribe.py PCM reading, prompt and warm-up helpers."""
+
+import sys
+import os
+import io
+import types
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "recorder", "scripts"))
+import stream_transcribe
+from stream_transcribe import PROMPT_CONTEXT_CHARS, SILENCE_RMS, build_prompt, read_pcm_stdin
+
+CHUNK_SECONDS = 0.1
+CHUNK_SAMPLES = 1600
+
+
+def read_chunks(pcm: np.ndarray, count: int) -> list:
+    """Call read_pcm_stdin count times with pcm (int16) as stdin's bytes."""
+    saved = sys.stdin
+    sys.stdin = types.SimpleNamespace(buffer=io.BytesIO(pcm.astype("<i2").tobytes()))
+    try:
+        results = []
+        for _ in range(count):
+            result = read_pcm_stdin(CHUNK_SECONDS)
+            # Copy: samples is a view that the next read overwrites
+            if result is not None and result[0] is not None:
+                result = (result[0].copy(), result[1])
+            results.append(result)
+        return results
+    finally:
+        sys.stdin = saved
+
+
+def test_silence_gate_either_side_of_threshold():
+    """Constant chunks just under/over SILENCE_RMS are gated/kept."""
+    threshold = SILENCE_RMS * 32768  # int16 amplitude of a constant at the gate
+    quiet = np.full(CHUNK_SAMPLES, int(threshold), dtype=np.int16)
+    loud = np.full(CHUNK_SAMPLES, int(threshold) + 1, dtype=np.int16)
+    results = read_chunks(np.concatenate([quiet, loud]), 3)
+
+    assert results[0] == (None, True), results[0]
+    samples, is_silent = results[1]
+    assert not is_silent
+    assert samples.dtype == np.float32 and samples.shape == (CHUNK_SAMPLES,)
+    assert np.allclose(samples, (int(threshold) + 1) / 32768.0)
+    assert results[2] is None  # EOF
+    print("PASS: silence gate either side of SILENCE_RMS")
+
+
+def test_short_read_at_eof_is_zero_padded():
+    """A partial final chunk is padded with zeros to the full chunk size."""
+    tail = np.full(CHUNK_SAMPLES // 2, 1000, dtype=np.int16)
+    results = read_chunks(tail, 2)
+
+    samples, is_silent = results[0]
+    assert not is_silent and samples.shape == (CHUNK_SAMPLES,)
+    assert np.allclose(samples[:CHUNK_SAMPLES // 2], 1000 / 32768.0)
+    assert not samples[CHUNK_SAMPLES // 2:].any()
+    assert results[1] is None
+    print("PASS: short read at EOF is zero-padded")
+
+
+def test_buffers_are_reused_across_reads():
+    """Each read overwrites the same float32 buffer instead of allocating."""
+    pcm = np.concatenate([np.full(CHUNK_SAMPLES, 1000, dtype=np.int16),
+                          np.full(CHUNK_SAMPLES, -2000, dtype=np.int16)])
+    saved = sys.stdin
+    sys.stdin = types.SimpleNamespace(buffer=io.BytesIO(pcm.astype("<i2").tobytes()))
+    try:
+        first, _ = read_pcm_stdin(CHUNK_SECONDS)
+        second, _ = read_pcm_stdin(CHUNK_SECONDS)
+    finally:
+        sys.stdin = saved
+
+    assert np.shares_memory(first, second)
+    assert np.allclose(first, -2000 / 32768.0)  # overwritten by the second read
+    print("PASS: PCM buffers are reused across reads")
+
+
+def test_prompt_context_cut_mid_word_drops_fragment():
+    """A slice starting inside a word loses that fragment."""
+    previous = "some earlier abc " + "w" * (PROMPT_CONTEXT_CHARS - 3)
+    # The slice starts at "bc ", a fragment of "abc"
+    assert previous[-PROMPT_CONTEXT_CHARS:].startswith("bc ")
+    assert build_prompt(None, previous) == "w" * (PROMPT_CONTEXT_CHARS - 3)
+    print("PASS: mid-word cut drops the leading fragment")
+
+
+def test_prompt_context_on_word_boundary_is_kept():
+    """A slice starting right after a space already begins with a whole word."""
+    first_word = "hello"
+    tail = first_word + " " + "w" * (PROMPT_CONTEXT_CHARS - len(first_word) - 1)
+    previous = "earlier words " + tail
+    assert previous[-PROMPT_CONTEXT_CHARS - 1] == " "
+    assert build_prompt(None, previous) == tail
+    print("PASS: slice on a word boundary keeps its first word")
+
+
+def test_prompt_short_and_unspaced_context():
+    """Short text is used whole; unspaced text is kept as the raw slice."""
+    assert build_prompt("Kubernetes, Claudia", "we met") == "Kubernetes, Claudia we met"
+    assert build_prompt(None, "") is None
+    cjk = "会" * (PROMPT_CONTEXT_CHARS + 50)
+    assert build_prompt(None, cjk) == "会" * PROMPT_CONTEXT_CHARS
+    print("PASS: short and unspaced context")
+
+
+
+def test_warm_up_matches_live_decoding():
+    """Warm-up runs with exactly the kwargs a live chunk uses."""
+    calls = []
+    fake_mlx_whisper = types.ModuleType("mlx_whisper")
+    fake_mlx_whisper.transcribe = lambda audio, **kwargs: calls.append(kwargs) or {}
+    saved = sys.modules.get("mlx_whisper")
+    sys.modules["mlx_whisper"] = fake_mlx_whisper
+    try:
+        stream_transcribe.warm_up("model", "en", "Kubernetes, Claudia")
+        stream_transcribe.transcribe_chunk(
+            np.zeros(CHUNK_SAMPLES, dtype=np.float32), "model", "en", "Kubernetes, Claudia"
+        )
+    finally:
+        if saved is None:
+            sys.modules.pop("mlx_whisper", None)
+        else:
+            sys.modules["mlx_whisper"] = saved
+
+    assert len(calls) == 2 and calls[0] == calls[1], calls
+    assert calls[0]["word_timestamps"] is True and calls[0]["temperature"] == 0.2
+    print("PASS: warm-up uses the live decoding parameters")
+
+
+if __name__ == "__main__":
+    test_silence_gate_either_side_of_threshold()
+    test_short_read_at_eof_is_zero_padded()
+    test_buffers_are_reused_across_reads()
+    test_warm_up_matches_live_decoding()
+    test_prompt_context_cut_mid_word_drops_fragment()
+    test_prompt_context_on_word_boundary_is_kept()
+    test_prompt_short_and_unspaced_context()
+    print("\nAll stream_transcribe tests passed.")